@@ -1,6 +1,10 @@
 import streamlit as st
-from utils.template_engine import render_template, get_all_templates
-from utils.ai_suggestions import get_ai_suggestions
+from utils.template_engine import render_template, render_template_to_file, get_all_templates
+from utils.html_output import preview_html
+from utils.analysis_view import show_offline_notice, stream_ai_analysis
+from utils.draft_store import autosave_draft, restore_draft
+from utils.ats_scorer import score_resume
+from utils.pdf_export import cached_pdf, html_to_pdf, pdf_available, warm_pdf_pool_in_background
 
 def show_preview():
     st.title("👁️ Resume Preview & AI Analysis")
@@ -33,28 +37,51 @@ def show_resume_preview():
     
     # Display resume
     html_content = render_template(selected_template, st.session_state.resume_data)
-    st.components.v1.html(html_content, height=800, scrolling=True)
+    # Minified, with the stylesheet linked as a static asset, so reruns ship only the markup
+    st.components.v1.html(preview_html(html_content), height=800, scrolling=True)
     
-    # Download option
+    # Download option - streamed minified but self-contained, optionally gzipped
+    compress = st.checkbox("Compress download (.html.gz)", key="preview_compress")
     st.download_button(
         label="📄 Download HTML Resume",
-        data=html_content,
-        file_name="resume.html",
-        mime="text/html"
+        data=render_template_to_file(selected_template, st.session_state.resume_data, minify=True, compress=compress),
+        file_name="resume.html.gz" if compress else "resume.html",
+        mime="application/gzip" if compress else "text/html"
     )
+    
+    if pdf_available():
+        show_pdf_export(html_content)
+
+def show_pdf_export(html_content: str):
+    # Only a cache hit is free; rendering waits for an explicit click
+    pdf = cached_pdf(html_content)
+    if pdf is None and st.button("📑 Export PDF"):
+        with st.spinner("Rendering PDF..."):
+            try:
+                pdf = html_to_pdf(html_content)
+            except Exception as e:
+                st.error(f"❌ PDF export failed: {e}")
+    if pdf is not None:
+        st.download_button(
+            label="📑 Download PDF Resume",
+            data=pdf,
+            file_name="resume.pdf",
+            mime="application/pdf"
+        )
 
 def show_ai_analysis():
     st.header("🤖 AI-Powered Resume Analysis")
+    st.caption(f"⚡ Instant offline ATS score: {score_resume(st.session_state.resume_data)['ats_score']}/100")
     
     if st.button("🔄 Analyze Resume with AI", type="primary"):
-        with st.spinner("Analyzing your resume with AI..."):
-            st.session_state.ai_analysis = get_ai_suggestions(st.session_state.resume_data)
+        st.session_state.ai_analysis = stream_ai_analysis(st.session_state.resume_data)
     
     if 'ai_analysis' not in st.session_state:
         st.info("Click the button above to get AI suggestions for your resume")
         return
     
     analysis = st.session_state.ai_analysis
+    show_offline_notice(analysis)
     
     # Display ATS Score
     st.metric("ATS Score", f"{analysis.get('ats_score', 0)}/100")
@@ -67,4 +94,7 @@ def show_ai_analysis():
         st.write(f"• {suggestion}")
 
 if __name__ == "__main__":
-    show_preview()
\ No newline at end of file
+    restore_draft()
+    warm_pdf_pool_in_background()
+    show_preview()
+    autosave_draft()
\ No newline at end of file
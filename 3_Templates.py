@@ -1,4 +1,7 @@
 import streamlit as st
+from utils.draft_store import autosave_draft, restore_draft
+from utils.template_engine import get_all_templates
+from utils.template_gallery import THUMBNAIL_HEIGHT, gallery_thumbnails, prerender_gallery
 
 def show_templates():
     st.title("🎨 Choose Your Template")
@@ -10,11 +13,16 @@ def show_templates():
             st.switch_page("pages/1_Build_Resume.py")
         return
     
-    templates = {
-        'template1': {'name': 'Professional', 'description': 'Clean design'},
-        'template2': {'name': 'Modern', 'description': 'Contemporary style'},
-        'template3': {'name': 'Creative', 'description': 'Creative layout'}
-    }
+    templates = get_all_templates()
+    
+    # Pre-rendered with a sample resume; the user's own data renders only what changed
+    use_my_data = st.toggle("Preview with my resume data", key="gallery_user_data")
+    if use_my_data:
+        thumbnails = gallery_thumbnails(st.session_state.resume_data)
+    else:
+        thumbnails = gallery_thumbnails()
+        # Warm the user's thumbnails in the background so flipping the toggle is instant
+        prerender_gallery(st.session_state.resume_data)
     
     cols = st.columns(3)
     for idx, (template_id, template_info) in enumerate(templates.items()):
@@ -22,6 +30,7 @@ def show_templates():
         with col:
             st.subheader(template_info['name'])
             st.caption(template_info['description'])
+            st.components.v1.html(thumbnails[template_id], height=THUMBNAIL_HEIGHT)
             if st.button(f"Select {template_info['name']}", key=template_id):
                 st.session_state.selected_template = template_id
                 st.success(f"Selected {template_info['name']}!")
@@ -32,4 +41,6 @@ def show_templates():
             st.switch_page("pages/3_Preview.py")
 
 if __name__ == "__main__":
-    show_templates()
\ No newline at end of file
+    restore_draft()
+    show_templates()
+    autosave_draft()
\ No newline at end of file
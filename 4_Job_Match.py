@@ -0,0 +1,7 @@
+from utils.draft_store import autosave_draft, restore_draft
+from utils.job_match_view import show_job_match
+
+if __name__ == "__main__":
+    restore_draft()
+    show_job_match()
+    autosave_draft()
@@ -1,93 +1,324 @@
-import openai
+import asyncio
+import copy
 import os
 import json
-from typing import Dict
+import threading
+from typing import TYPE_CHECKING, Any, Dict, Iterator, List, Optional, Tuple
 from dotenv import load_dotenv
+from utils.analysis_cache import get_analysis_cache
+from utils.ats_scorer import score_resume
+from utils.json_stream import IncrementalJSONParser
+from utils.prompt_builder import build_analysis_prompt, build_section_prompt, record_token_usage, token_usage_stats
 
+if TYPE_CHECKING:
+    import httpx
+    import openai
+
+# openai and httpx are imported on first use: together they add ~170 ms to a cold start,
+# and sessions without an API key never need them. dotenv is cheap and must run before
+# the settings below are read.
 load_dotenv()
 
+OPENAI_MODEL = os.getenv('OPENAI_MODEL', 'gpt-3.5-turbo')
+
+# Bump whenever the prompt changes so cached analyses from the old prompt are not reused
+PROMPT_VERSION = 2
+
+# Connection pool shared by every analysis in the process
+OPENAI_MAX_CONNECTIONS = int(os.getenv('OPENAI_MAX_CONNECTIONS', '20'))
+OPENAI_MAX_KEEPALIVE_CONNECTIONS = int(os.getenv('OPENAI_MAX_KEEPALIVE_CONNECTIONS', '10'))
+OPENAI_KEEPALIVE_EXPIRY = float(os.getenv('OPENAI_KEEPALIVE_EXPIRY', '60'))
+OPENAI_TIMEOUT = float(os.getenv('OPENAI_TIMEOUT', '60'))
+OPENAI_BATCH_CONCURRENCY = int(os.getenv('OPENAI_BATCH_CONCURRENCY', '8'))
+
+# Analysis section -> resume_data keys it covers, for incremental re-analysis
+ANALYSIS_SECTIONS = {
+    'personal_info': ('personal_info',),
+    'experience': ('experience',),
+    'education': ('education',),
+    'skills': ('technical_skills', 'soft_skills'),
+    'projects': ('projects',),
+    'certifications': ('certifications', 'languages')
+}
+# Past this share of changed sections a full analysis is cheaper than merging
+INCREMENTAL_MAX_CHANGED = 0.5
+# 'source' of analyses from the offline scorer, which never serve as a re-analysis baseline
+OFFLINE_SOURCE = 'offline'
+
+def offline_analysis(resume_data: Dict) -> Dict:
+    """Score the resume locally, tagged so it is never taken for a model analysis"""
+    analysis = score_resume(resume_data)
+    analysis['source'] = OFFLINE_SOURCE
+    return analysis
+
+def is_offline_analysis(analysis: Optional[Dict]) -> bool:
+    return bool(analysis) and analysis.get('source') == OFFLINE_SOURCE
+
+def changed_sections(previous_data: Dict, resume_data: Dict) -> List[str]:
+    """Analysis sections whose resume data differs between two versions"""
+    return [
+        section for section, keys in ANALYSIS_SECTIONS.items()
+        if [previous_data.get(key) for key in keys] != [resume_data.get(key) for key in keys]
+    ]
+
+def merge_section_analysis(previous_analysis: Dict, update: Dict, sections: List[str], resume_data: Dict) -> Dict:
+    """Fold a re-analysis of some sections into the analysis of the whole resume"""
+    analysis = copy.deepcopy(previous_analysis)
+    analysis['ats_score'] = update.get('ats_score', analysis.get('ats_score', 0))
+    
+    suggestions = analysis.setdefault('suggestions', {})
+    section_feedback = suggestions.setdefault('section_feedback', {})
+    new_section_feedback = update.get('section_feedback', {})
+    for section in sections:
+        section_feedback[section] = new_section_feedback.get(section, [])
+    
+    new_feedback = update.get('overall_feedback', [])
+    old_feedback = [item for item in suggestions.get('overall_feedback', []) if item not in new_feedback]
+    suggestions['overall_feedback'] = (new_feedback + old_feedback)[:8]
+    
+    keywords = update.get('missing_keywords', []) + suggestions.get('missing_keywords', [])
+    suggestions['missing_keywords'] = list(dict.fromkeys(keywords))
+    
+    improved_content = dict(analysis.get('improved_content') or resume_data)
+    new_content = update.get('improved_content', {})
+    for section in sections:
+        for key in ANALYSIS_SECTIONS[section]:
+            improved_content[key] = new_content.get(key, resume_data.get(key))
+    analysis['improved_content'] = improved_content
+    return analysis
+
+def _pool_limits(max_connections: int = OPENAI_MAX_CONNECTIONS) -> 'httpx.Limits':
+    import httpx
+    
+    return httpx.Limits(
+        max_connections=max_connections,
+        max_keepalive_connections=min(OPENAI_MAX_KEEPALIVE_CONNECTIONS, max_connections),
+        keepalive_expiry=OPENAI_KEEPALIVE_EXPIRY
+    )
+
+def create_http_client() -> 'httpx.Client':
+    """HTTP client with keep-alive pooling sized by the OPENAI_* pool settings"""
+    import httpx
+    
+    return httpx.Client(limits=_pool_limits(), timeout=OPENAI_TIMEOUT)
+
 class AISuggestionsEngine:
-    def __init__(self):
+    def __init__(self, http_client: Optional['httpx.Client'] = None):
         api_key = os.getenv('OPENAI_API_KEY')
         if api_key and api_key != 'your_openai_api_key_here':
-            self.client = openai.OpenAI(api_key=api_key)
+            import openai
+            
+            self.api_key = api_key
+            self.client = openai.OpenAI(api_key=api_key, http_client=http_client or create_http_client())
             self.use_ai = True
         else:
             self.use_ai = False
     
-    def analyze_resume(self, resume_data: Dict) -> Dict:
-        if self.use_ai:
-            return self._get_ai_analysis(resume_data)
-        else:
-            return self._get_mock_analysis(resume_data)
+    def analyze_resume(self, resume_data: Dict, previous_data: Optional[Dict] = None,
+                       previous_analysis: Optional[Dict] = None) -> Dict:
+        """Analyze a resume, re-analyzing only edited sections when the previous analysis is given"""
+        if not self.use_ai:
+            return self._get_offline_analysis(resume_data)
+        
+        sections = self._incremental_sections(resume_data, previous_data, previous_analysis)
+        if sections is None:
+            return self._get_cached_ai_analysis(resume_data)
+        if not sections:
+            return previous_analysis
+        return self._reanalyze_sections(resume_data, sections, previous_analysis)
+    
+    def _incremental_sections(self, resume_data: Dict, previous_data: Optional[Dict],
+                              previous_analysis: Optional[Dict]) -> Optional[List[str]]:
+        """Sections to re-analyze, or None when a full analysis is needed"""
+        # Merging model feedback into an offline fallback would keep the fallback forever
+        if previous_data is None or not previous_analysis or is_offline_analysis(previous_analysis):
+            return None
+        sections = changed_sections(previous_data, resume_data)
+        if len(sections) > len(ANALYSIS_SECTIONS) * INCREMENTAL_MAX_CHANGED:
+            return None
+        return sections
     
-    def _get_ai_analysis(self, resume_data: Dict) -> Dict:
+    def _reanalyze_sections(self, resume_data: Dict, sections: List[str], previous_analysis: Dict) -> Dict:
+        cache = get_analysis_cache()
+        cache_key = cache.key(resume_data, OPENAI_MODEL, PROMPT_VERSION)
+        analysis = cache.get(cache_key)
+        if analysis is not None:
+            return analysis
+        
+        updated = {key: resume_data.get(key) for section in sections for key in ANALYSIS_SECTIONS[section]}
+        messages, estimate = build_section_prompt(updated, sections, previous_analysis.get('ats_score'))
         try:
-            prompt = self._create_analysis_prompt(resume_data)
-            
             response = self.client.chat.completions.create(
-                model="gpt-3.5-turbo",
-                messages=[
-                    {"role": "system", "content": "You are an expert resume coach and ATS specialist."},
-                    {"role": "user", "content": prompt}
-                ],
-                max_tokens=1500
+                model=OPENAI_MODEL,
+                messages=messages,
+                max_tokens=estimate['max_tokens']
             )
-            
-            return self._parse_ai_response(response.choices[0].message.content)
-        except Exception as e:
-            return self._get_mock_analysis(resume_data)
-    
-    def _get_mock_analysis(self, resume_data: Dict) -> Dict:
-        """Provide mock analysis when AI is not available"""
-        return {
-            'ats_score': 75,
-            'suggestions': {
-                'overall_feedback': [
-                    "Add more quantifiable achievements to your experience section",
-                    "Include specific numbers and metrics to show impact",
-                    "Use strong action verbs like 'managed', 'developed', 'implemented'",
-                    "Tailor your skills to match your target job descriptions",
-                    "Consider adding a projects section to showcase practical experience"
-                ],
-                'section_feedback': {
-                    'personal_info': ["Ensure your summary is compelling and keyword-rich"],
-                    'experience': ["Focus on accomplishments rather than responsibilities"],
-                    'skills': ["Categorize skills (technical vs soft skills)"]
-                },
-                'missing_keywords': ['leadership', 'management', 'optimization', 'strategy', 'analysis']
-            },
-            'improved_content': resume_data
-        }
-    
-    def _create_analysis_prompt(self, resume_data: Dict) -> str:
-        return f"""
-        Analyze this resume data and provide constructive feedback:
-        
-        {json.dumps(resume_data, indent=2)}
-        
-        Provide feedback in this JSON format:
-        {{
-            "ats_score": 0-100,
-            "suggestions": {{
-                "overall_feedback": ["list of suggestions"],
-                "section_feedback": {{
-                    "personal_info": ["suggestions"],
-                    "experience": ["suggestions"],
-                    "skills": ["suggestions"]
-                }},
-                "missing_keywords": ["list of keywords"]
-            }},
-            "improved_content": {resume_data}
-        }}
-        """
+            record_token_usage(estimate, response.usage)
+            update = json.loads(response.choices[0].message.content)
+        except Exception:
+            return self._get_cached_ai_analysis(resume_data)
+        
+        analysis = merge_section_analysis(previous_analysis, update, sections, resume_data)
+        cache.put(cache_key, analysis)
+        return analysis
     
-    def _parse_ai_response(self, response: str) -> Dict:
+    def _get_cached_ai_analysis(self, resume_data: Dict) -> Dict:
+        cache = get_analysis_cache()
+        cache_key = cache.key(resume_data, OPENAI_MODEL, PROMPT_VERSION)
+        analysis = cache.get(cache_key)
+        if analysis is not None:
+            return analysis
+        
         try:
-            return json.loads(response)
-        except:
-            return self._get_mock_analysis({})
+            analysis = self._request_analysis(resume_data)
+        except Exception:
+            # Fallbacks are not cached so the next attempt goes back to the model
+            return self._get_offline_analysis(resume_data)
+        
+        cache.put(cache_key, analysis)
+        return analysis
+    
+    def _request_analysis(self, resume_data: Dict) -> Dict:
+        messages, estimate = build_analysis_prompt(resume_data)
+        response = self.client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            max_tokens=estimate['max_tokens']
+        )
+        record_token_usage(estimate, response.usage)
+        
+        return json.loads(response.choices[0].message.content)
+    
+    def analyze_resume_stream(self, resume_data: Dict, previous_data: Optional[Dict] = None,
+                              previous_analysis: Optional[Dict] = None) -> Iterator[Tuple[Optional[Tuple], Any]]:
+        """Stream an analysis as it is generated.
+        
+        Yields (path, value) for each field as soon as the model has finished
+        writing it, e.g. (('ats_score',), 82), then a final (None, analysis)
+        with the complete result. Cached, mock and incremental analyses arrive
+        as the final item only.
+        """
+        if not self.use_ai or self._incremental_sections(resume_data, previous_data, previous_analysis) is not None:
+            yield None, self.analyze_resume(resume_data, previous_data, previous_analysis)
+            return
+        
+        cache = get_analysis_cache()
+        cache_key = cache.key(resume_data, OPENAI_MODEL, PROMPT_VERSION)
+        analysis = cache.get(cache_key)
+        if analysis is not None:
+            yield None, analysis
+            return
+        
+        parser = IncrementalJSONParser()
+        content = []
+        messages, estimate = build_analysis_prompt(resume_data)
+        try:
+            stream = self.client.chat.completions.create(
+                model=OPENAI_MODEL,
+                messages=messages,
+                max_tokens=estimate['max_tokens'],
+                stream=True
+            )
+            # Streamed responses carry no usage block, so only the estimate is recorded
+            record_token_usage(estimate)
+            for chunk in stream:
+                if not chunk.choices or not chunk.choices[0].delta.content:
+                    continue
+                delta = chunk.choices[0].delta.content
+                content.append(delta)
+                yield from parser.feed(delta)
+            # Tolerate a markdown fence around the JSON, as the parser does
+            text = ''.join(content)
+            analysis = json.loads(text[text.index('{'):text.rindex('}') + 1])
+        except Exception:
+            yield None, self._get_offline_analysis(resume_data)
+            return
+        
+        cache.put(cache_key, analysis)
+        yield None, analysis
+    
+    async def analyze_async(self, resume_data: Dict, client: 'openai.AsyncOpenAI') -> Dict:
+        """Analyze one resume on an async client, raising instead of falling back to the offline scorer"""
+        cache = get_analysis_cache()
+        cache_key = cache.key(resume_data, OPENAI_MODEL, PROMPT_VERSION)
+        analysis = cache.get(cache_key)
+        if analysis is not None:
+            return analysis
+        
+        messages, estimate = build_analysis_prompt(resume_data)
+        response = await client.chat.completions.create(
+            model=OPENAI_MODEL,
+            messages=messages,
+            max_tokens=estimate['max_tokens']
+        )
+        record_token_usage(estimate, response.usage)
+        analysis = json.loads(response.choices[0].message.content)
+        cache.put(cache_key, analysis)
+        return analysis
+    
+    async def analyze_many_async(self, resumes: List[Dict], concurrency: int = OPENAI_BATCH_CONCURRENCY) -> List[Dict]:
+        """Analyze resumes with at most `concurrency` requests in flight.
+        
+        Results keep the input order; each is {'analysis': ..., 'error': None}
+        or {'analysis': None, 'error': message} for items that failed.
+        """
+        if concurrency < 1:
+            raise ValueError(f"concurrency must be at least 1, got {concurrency}")
+        if not self.use_ai:
+            return [{'analysis': self._get_offline_analysis(resume_data), 'error': None} for resume_data in resumes]
+        
+        import httpx
+        import openai
+        
+        semaphore = asyncio.Semaphore(concurrency)
+        results = [None] * len(resumes)
+        
+        # Async connections are bound to the running event loop, so the client lives per batch
+        http_client = httpx.AsyncClient(limits=_pool_limits(concurrency), timeout=OPENAI_TIMEOUT)
+        async with openai.AsyncOpenAI(api_key=self.api_key, http_client=http_client) as client:
+            async def analyze_item(index: int, resume_data: Dict):
+                async with semaphore:
+                    try:
+                        results[index] = {'analysis': await self.analyze_async(resume_data, client), 'error': None}
+                    except Exception as e:
+                        results[index] = {'analysis': None, 'error': f"{type(e).__name__}: {e}"}
+            
+            await asyncio.gather(*(analyze_item(index, resume_data) for index, resume_data in enumerate(resumes)))
+        
+        return results
+    
+    def analyze_many(self, resumes: List[Dict], concurrency: int = OPENAI_BATCH_CONCURRENCY) -> List[Dict]:
+        """Blocking wrapper around analyze_many_async for scripts and offline jobs"""
+        return asyncio.run(self.analyze_many_async(resumes, concurrency))
+    
+    def _get_offline_analysis(self, resume_data: Dict) -> Dict:
+        """Score the resume locally when the model is unavailable"""
+        return offline_analysis(resume_data)
+
+_engine = None
+_engine_lock = threading.Lock()
+
+def get_engine() -> AISuggestionsEngine:
+    """Process-wide engine, so every session reuses one client and its open connections"""
+    global _engine
+    if _engine is None:
+        with _engine_lock:
+            if _engine is None:
+                _engine = AISuggestionsEngine()
+    return _engine
+
+def get_ai_suggestions(resume_data: Dict, previous_data: Optional[Dict] = None,
+                       previous_analysis: Optional[Dict] = None) -> Dict:
+    return get_engine().analyze_resume(resume_data, previous_data, previous_analysis)
+
+def stream_ai_suggestions(resume_data: Dict, previous_data: Optional[Dict] = None,
+                          previous_analysis: Optional[Dict] = None) -> Iterator[Tuple[Optional[Tuple], Any]]:
+    return get_engine().analyze_resume_stream(resume_data, previous_data, previous_analysis)
+
+def analysis_cache_stats() -> Dict:
+    """Hit/miss counters of the AI analysis cache"""
+    return get_analysis_cache().stats()
 
-def get_ai_suggestions(resume_data: Dict) -> Dict:
-    engine = AISuggestionsEngine()
-    return engine.analyze_resume(resume_data)
\ No newline at end of file
+def token_usage() -> Dict:
+    """Estimated and reported token totals for model calls made by this process"""
+    return token_usage_stats()
\ No newline at end of file
@@ -0,0 +1,114 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Optional
+from utils.cache import LRUCache, canonical_hash
+from utils.resume_model import Resume
+
+ANALYSIS_CACHE_PATH = os.getenv('NEURACV_ANALYSIS_CACHE_PATH', os.path.join("data", "analysis_cache.sqlite3"))
+ANALYSIS_CACHE_TTL = float(os.getenv('NEURACV_ANALYSIS_CACHE_TTL', str(7 * 24 * 3600)))
+
+class AnalysisCache:
+    """Two-tier cache of AI analyses: an in-process LRU in front of a sqlite file shared by all workers"""
+
+    def __init__(self, path: str = ANALYSIS_CACHE_PATH, ttl: float = ANALYSIS_CACHE_TTL, max_entries: int = 512):
+        self.path = path
+        self.ttl = ttl
+        self._memory = LRUCache(max_entries=max_entries, max_bytes=16 * 1024 * 1024,
+                                sizeof=lambda entry: len(json.dumps(entry[1], ensure_ascii=False)))
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(resume_data: Dict, model: str, prompt_version: int) -> str:
+        # Resumes that differ only in whitespace, empty entries or stray keys share an analysis
+        return canonical_hash(Resume.from_dict(resume_data).content_hash, model, prompt_version)
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared across threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS analyses ("
+                "key TEXT PRIMARY KEY, created_at REAL NOT NULL, analysis TEXT NOT NULL)"
+            )
+            connection.execute("CREATE INDEX IF NOT EXISTS analyses_created_at ON analyses (created_at)")
+            self._local.connection = connection
+        return connection
+
+    def get(self, key: str) -> Optional[Dict]:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None and now - entry[0] < self.ttl:
+            self._count('memory_hits')
+            return copy.deepcopy(entry[1])
+
+        try:
+            row = self._connection().execute(
+                "SELECT created_at, analysis FROM analyses WHERE key = ? AND created_at > ?",
+                (key, now - self.ttl)
+            ).fetchone()
+        except sqlite3.Error:
+            row = None
+        if row is None:
+            self._count('misses')
+            return None
+
+        analysis = json.loads(row[1])
+        self._memory.put(key, (row[0], analysis))
+        self._count('disk_hits')
+        return copy.deepcopy(analysis)
+
+    def put(self, key: str, analysis: Dict) -> None:
+        now = time.time()
+        self._memory.put(key, (now, copy.deepcopy(analysis)))
+        try:
+            connection = self._connection()
+            connection.execute(
+                "INSERT OR REPLACE INTO analyses (key, created_at, analysis) VALUES (?, ?, ?)",
+                (key, now, json.dumps(analysis, ensure_ascii=False, separators=(',', ':')))
+            )
+            connection.execute("DELETE FROM analyses WHERE created_at <= ?", (now - self.ttl,))
+        except sqlite3.Error:
+            # The memory tier still serves this process if the shared file is unavailable
+            pass
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stats(self) -> Dict:
+        with self._lock:
+            lookups = self.memory_hits + self.disk_hits + self.misses
+            hits = self.memory_hits + self.disk_hits
+            return {
+                'memory_hits': self.memory_hits,
+                'disk_hits': self.disk_hits,
+                'misses': self.misses,
+                'hit_rate': hits / lookups if lookups else 0.0,
+                'memory_entries': len(self._memory)
+            }
+
+_analysis_cache = None
+_analysis_cache_lock = threading.Lock()
+
+def get_analysis_cache() -> AnalysisCache:
+    """Process-wide analysis cache"""
+    global _analysis_cache
+    if _analysis_cache is None:
+        with _analysis_cache_lock:
+            if _analysis_cache is None:
+                _analysis_cache = AnalysisCache()
+    return _analysis_cache
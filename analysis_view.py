@@ -0,0 +1,39 @@
+import streamlit as st
+import copy
+from utils.ai_suggestions import is_offline_analysis, stream_ai_suggestions
+
+def stream_ai_analysis(resume_data: dict) -> dict:
+    """Show the ATS score and feedback as the model writes them, then return the full analysis"""
+    live = st.empty()
+    analysis = {}
+    with live.container():
+        st.caption("🤖 Analyzing your resume with AI...")
+        score_slot = st.empty()
+        feedback = st.container()
+        # Passing the last analyzed version lets the engine re-analyze only edited sections
+        updates = stream_ai_suggestions(
+            resume_data,
+            st.session_state.get('analyzed_resume_data'),
+            st.session_state.get('ai_analysis')
+        )
+        for path, value in updates:
+            if path is None:
+                analysis = value
+            elif path == ('ats_score',):
+                score_slot.metric("ATS Score", f"{value}/100")
+            elif path[:2] == ('suggestions', 'overall_feedback'):
+                feedback.write(f"• {value}")
+    # The complete analysis is rendered by the caller; a stream that failed partway has
+    # shown model output that is not the result, so nothing of the preview may stay
+    live.empty()
+    if is_offline_analysis(analysis):
+        # Only a model analysis is a baseline for re-analyzing edited sections
+        st.session_state.pop('analyzed_resume_data', None)
+    else:
+        st.session_state.analyzed_resume_data = copy.deepcopy(resume_data)
+    return analysis
+
+def show_offline_notice(analysis: dict) -> None:
+    """Say so when the analysis shown is the offline fallback rather than the model's"""
+    if is_offline_analysis(analysis):
+        st.warning("⚠️ AI analysis is unavailable right now, so this is the offline ATS score. Try again later.")
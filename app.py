@@ -1,8 +1,15 @@
 import streamlit as st
 from streamlit_option_menu import option_menu
-from utils.ai_suggestions import get_ai_suggestions
+from utils.ai_suggestions import is_offline_analysis
+from utils.analysis_view import show_offline_notice, stream_ai_analysis
+from utils.draft_store import autosave_draft, restore_draft
+from utils.ats_scorer import score_resume
+from utils.keyword_index import keyword_gap
 from utils.template_engine import render_template, get_all_templates
-from utils.resume_parser import parse_resume
+from utils.template_gallery import THUMBNAIL_HEIGHT, gallery_thumbnails, prerender_gallery
+from utils.pdf_export import warm_pdf_pool_in_background
+from utils.job_match_view import show_job_match
+from utils.resume_builder import show_build_resume
 
 # Page configuration
 st.set_page_config(
@@ -38,8 +45,8 @@ def main():
         
         selected = option_menu(
             menu_title="Navigation",
-            options=["Home", "Build Resume", "Templates", "Preview & AI"],
-            icons=["house", "pencil", "palette", "robot"],
+            options=["Home", "Build Resume", "Templates", "Preview & AI", "Job Match"],
+            icons=["house", "pencil", "palette", "robot", "briefcase"],
             menu_icon="cast",
             default_index=0,
             styles={
@@ -56,6 +63,11 @@ def main():
             }
         )
     
+    # Restore the draft named in the URL before any page reads resume_data
+    restore_draft()
+    # PDF renderers start on the first page run, well before anyone exports
+    warm_pdf_pool_in_background()
+    
     # Page routing - ALL IN ONE FILE
     if selected == "Home":
         show_homepage()
@@ -65,6 +77,10 @@ def main():
         show_templates()
     elif selected == "Preview & AI":
         show_preview_ai()
+    elif selected == "Job Match":
+        show_job_match()
+    
+    autosave_draft()
 
 def show_homepage():
     st.title("🚀 NEURACV - AI-Powered Resume Builder")
@@ -101,390 +117,6 @@ def show_homepage():
         - Include relevant keywords from job descriptions
         """)
 
-def show_build_resume():
-    st.title("📄 Build Your Resume")
-    st.markdown("---")
-    
-    # Initialize session state
-    if 'resume_data' not in st.session_state:
-        st.session_state.resume_data = {
-            'personal_info': {},
-            'experience': [],
-            'education': [],
-            'technical_skills': [],
-            'soft_skills': [],
-            'projects': [],
-            'certifications': [],
-            'languages': []
-        }
-    
-    # Initialize lists
-    if 'experience' not in st.session_state:
-        st.session_state.experience = st.session_state.resume_data.get('experience', [{}])
-    
-    if 'education' not in st.session_state:
-        st.session_state.education = st.session_state.resume_data.get('education', [{}])
-    
-    if 'projects' not in st.session_state:
-        st.session_state.projects = st.session_state.resume_data.get('projects', [{}])
-    
-    # File upload section
-    st.header("📤 Upload Existing Resume (Optional)")
-    uploaded_file = st.file_uploader(
-        "Upload your existing resume to auto-fill the form",
-        type=['pdf', 'docx'],
-        help="We'll parse your resume and pre-fill the information below"
-    )
-    
-    if uploaded_file is not None:
-        with st.spinner("🔍 Parsing your resume..."):
-            try:
-                parsed_data = parse_resume(uploaded_file)
-                if parsed_data:
-                    st.session_state.resume_data.update(parsed_data)
-                    st.session_state.experience = st.session_state.resume_data.get('experience', [{}])
-                    st.session_state.education = st.session_state.resume_data.get('education', [{}])
-                    st.session_state.projects = st.session_state.resume_data.get('projects', [{}])
-                    st.success("✅ Resume parsed successfully! Form pre-filled below.")
-                    st.rerun()
-            except Exception as e:
-                st.error(f"❌ Error parsing file: {str(e)}")
-    
-    # Experience management buttons
-    col_exp1, col_exp2 = st.columns(2)
-    with col_exp1:
-        if st.button("➕ Add Another Experience", use_container_width=True):
-            st.session_state.experience.append({})
-            st.rerun()
-    with col_exp2:
-        if len(st.session_state.experience) > 1:
-            if st.button("🗑️ Remove Last Experience", use_container_width=True):
-                st.session_state.experience.pop()
-                st.rerun()
-    
-    # Education management buttons
-    col_edu1, col_edu2 = st.columns(2)
-    with col_edu1:
-        if st.button("➕ Add Another Education", use_container_width=True):
-            st.session_state.education.append({})
-            st.rerun()
-    with col_edu2:
-        if len(st.session_state.education) > 1:
-            if st.button("🗑️ Remove Last Education", use_container_width=True):
-                st.session_state.education.pop()
-                st.rerun()
-    
-    # Projects management buttons
-    if st.button("➕ Add Project", use_container_width=True):
-        st.session_state.projects.append({})
-        st.rerun()
-    
-    # Main form
-    with st.form("resume_builder", clear_on_submit=False):
-        st.markdown("### 👤 Personal Information")
-        
-        col1, col2 = st.columns(2)
-        
-        with col1:
-            name = st.text_input(
-                "Full Name*", 
-                value=st.session_state.resume_data.get('personal_info', {}).get('name', ''),
-                placeholder="John Doe"
-            )
-            email = st.text_input(
-                "Email Address*", 
-                value=st.session_state.resume_data.get('personal_info', {}).get('email', ''),
-                placeholder="john.doe@email.com"
-            )
-            phone = st.text_input(
-                "Phone Number*", 
-                value=st.session_state.resume_data.get('personal_info', {}).get('phone', ''),
-                placeholder="+1 (555) 123-4567"
-            )
-            
-        with col2:
-            linkedin = st.text_input(
-                "LinkedIn Profile URL", 
-                value=st.session_state.resume_data.get('personal_info', {}).get('linkedin', ''),
-                placeholder="https://linkedin.com/in/johndoe"
-            )
-            github = st.text_input(
-                "GitHub/Portfolio URL", 
-                value=st.session_state.resume_data.get('personal_info', {}).get('github', ''),
-                placeholder="https://github.com/johndoe"
-            )
-            location = st.text_input(
-                "Location*", 
-                value=st.session_state.resume_data.get('personal_info', {}).get('location', ''),
-                placeholder="City, State, Country"
-            )
-        
-        # Professional Summary
-        st.markdown("### 📝 Professional Summary")
-        summary = st.text_area(
-            "Write a compelling professional summary (2-3 sentences)*",
-            height=120,
-            value=st.session_state.resume_data.get('personal_info', {}).get('summary', ''),
-            placeholder="Experienced software engineer with 5+ years in full-stack development. Specialized in Python, React, and cloud technologies. Passionate about building scalable applications and leading cross-functional teams.",
-            help="Highlight your key achievements, skills, and career objectives"
-        )
-        
-        # Work Experience Section
-        st.markdown("### 💼 Work Experience")
-        
-        for i, exp in enumerate(st.session_state.experience):
-            with st.expander(f"🎯 Experience {i+1}", expanded=i==0):
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                with col1:
-                    st.text_input(
-                        f"Job Title*", 
-                        key=f"exp_title_{i}", 
-                        value=exp.get('title', ''),
-                        placeholder="Senior Software Engineer"
-                    )
-                
-                with col2:
-                    st.text_input(
-                        f"Company*", 
-                        key=f"exp_company_{i}", 
-                        value=exp.get('company', ''),
-                        placeholder="Tech Company Inc."
-                    )
-                
-                with col3:
-                    col3a, col3b = st.columns(2)
-                    with col3a:
-                        st.text_input(
-                            f"Start Date*", 
-                            key=f"exp_start_{i}", 
-                            value=exp.get('start_date', ''),
-                            placeholder="Jan 2020"
-                        )
-                    with col3b:
-                        st.text_input(
-                            f"End Date", 
-                            key=f"exp_end_{i}", 
-                            value=exp.get('end_date', ''),
-                            placeholder="Present"
-                        )
-                
-                st.text_area(
-                    f"Description & Achievements*", 
-                    key=f"exp_desc_{i}", 
-                    value=exp.get('description', ''),
-                    height=100,
-                    placeholder="• Led a team of 5 developers to deliver a new SaaS product\n• Improved application performance by 40% through optimization\n• Implemented CI/CD pipeline reducing deployment time by 60%\n• Managed project budget of $500K and delivered ahead of schedule",
-                    help="Use bullet points. Focus on achievements and quantify results with numbers."
-                )
-        
-        # Education Section
-        st.markdown("### 🎓 Education")
-        
-        for i, edu in enumerate(st.session_state.education):
-            with st.expander(f"📚 Education {i+1}", expanded=i==0):
-                col1, col2, col3 = st.columns([2, 1, 1])
-                
-                with col1:
-                    st.text_input(
-                        f"Degree/Certificate*", 
-                        key=f"edu_degree_{i}", 
-                        value=edu.get('degree', ''),
-                        placeholder="Bachelor of Science in Computer Science"
-                    )
-                
-                with col2:
-                    st.text_input(
-                        f"Institution*", 
-                        key=f"edu_institution_{i}", 
-                        value=edu.get('institution', ''),
-                        placeholder="University of Technology"
-                    )
-                
-                with col3:
-                    col3a, col3b = st.columns(2)
-                    with col3a:
-                        st.text_input(
-                            f"Graduation Year*", 
-                            key=f"edu_year_{i}", 
-                            value=edu.get('year', ''),
-                            placeholder="2020"
-                        )
-                    with col3b:
-                        st.text_input(
-                            f"GPA", 
-                            key=f"edu_gpa_{i}", 
-                            value=edu.get('gpa', ''),
-                            placeholder="3.8/4.0"
-                        )
-                
-                st.text_input(
-                    f"Relevant Coursework/Achievements", 
-                    key=f"edu_courses_{i}", 
-                    value=edu.get('courses', ''),
-                    placeholder="Data Structures, Algorithms, Machine Learning, Dean's List"
-                )
-        
-        # Skills Section
-        st.markdown("### 🛠️ Skills")
-        
-        col_skills1, col_skills2 = st.columns(2)
-        
-        with col_skills1:
-            technical_skills = st.text_area(
-                "Technical Skills*",
-                height=100,
-                value=", ".join(st.session_state.resume_data.get('technical_skills', [])),
-                placeholder="Python, JavaScript, React, Node.js, SQL, AWS, Docker, Git, Machine Learning, Data Analysis",
-                help="List your technical skills, programming languages, tools, and technologies"
-            )
-        
-        with col_skills2:
-            soft_skills = st.text_area(
-                "Soft Skills & Professional Skills",
-                height=100,
-                value=", ".join(st.session_state.resume_data.get('soft_skills', [])),
-                placeholder="Project Management, Leadership, Communication, Problem Solving, Team Collaboration, Agile Methodology",
-                help="List your soft skills and professional competencies"
-            )
-        
-        # Projects Section
-        st.markdown("### 🚀 Projects")
-        
-        for i, project in enumerate(st.session_state.projects):
-            with st.expander(f"💻 Project {i+1}", expanded=i==0):
-                st.text_input(
-                    f"Project Name*", 
-                    key=f"proj_name_{i}", 
-                    value=project.get('name', ''),
-                    placeholder="E-commerce Platform"
-                )
-                
-                st.text_input(
-                    f"Project URL/GitHub", 
-                    key=f"proj_url_{i}", 
-                    value=project.get('url', ''),
-                    placeholder="https://github.com/username/project"
-                )
-                
-                st.text_area(
-                    f"Project Description*", 
-                    key=f"proj_desc_{i}", 
-                    value=project.get('description', ''),
-                    height=80,
-                    placeholder="Developed a full-stack e-commerce platform with React and Node.js. Implemented user authentication, payment processing, and inventory management.",
-                    help="Describe the project, your role, technologies used, and outcomes"
-                )
-        
-        # Certifications & Languages
-        st.markdown("### 🏆 Certifications & Languages")
-        
-        col_cert1, col_cert2 = st.columns(2)
-        
-        with col_cert1:
-            certifications = st.text_area(
-                "Certifications & Awards",
-                height=80,
-                value=", ".join(st.session_state.resume_data.get('certifications', [])),
-                placeholder="AWS Certified Solutions Architect, Google Professional Data Engineer, Scrum Master Certification",
-                help="List relevant certifications, awards, and honors"
-            )
-        
-        with col_cert2:
-            languages = st.text_area(
-                "Languages",
-                height=80,
-                value=", ".join(st.session_state.resume_data.get('languages', [])),
-                placeholder="English (Native), Spanish (Professional), French (Basic)",
-                help="List languages you speak and proficiency levels"
-            )
-        
-        # SUBMIT BUTTON
-        submitted = st.form_submit_button("🤖 Save Resume & Generate AI Analysis", type="primary", use_container_width=True)
-        
-        if submitted:
-            # Validate required fields
-            if not name or not email or not summary:
-                st.error("❌ Please fill in all required fields (marked with *)")
-            else:
-                # Collect all form data
-                experience_data = []
-                for i in range(len(st.session_state.experience)):
-                    title = st.session_state.get(f'exp_title_{i}', '')
-                    company = st.session_state.get(f'exp_company_{i}', '')
-                    if title and company:
-                        experience_data.append({
-                            'title': title,
-                            'company': company,
-                            'start_date': st.session_state.get(f'exp_start_{i}', ''),
-                            'end_date': st.session_state.get(f'exp_end_{i}', ''),
-                            'description': st.session_state.get(f'exp_desc_{i}', '')
-                        })
-                
-                education_data = []
-                for i in range(len(st.session_state.education)):
-                    degree = st.session_state.get(f'edu_degree_{i}', '')
-                    institution = st.session_state.get(f'edu_institution_{i}', '')
-                    if degree and institution:
-                        education_data.append({
-                            'degree': degree,
-                            'institution': institution,
-                            'year': st.session_state.get(f'edu_year_{i}', ''),
-                            'gpa': st.session_state.get(f'edu_gpa_{i}', ''),
-                            'courses': st.session_state.get(f'edu_courses_{i}', '')
-                        })
-                
-                projects_data = []
-                for i in range(len(st.session_state.projects)):
-                    name = st.session_state.get(f'proj_name_{i}', '')
-                    if name:
-                        projects_data.append({
-                            'name': name,
-                            'url': st.session_state.get(f'proj_url_{i}', ''),
-                            'description': st.session_state.get(f'proj_desc_{i}', '')
-                        })
-                
-                # Save data to session state
-                st.session_state.resume_data = {
-                    'personal_info': {
-                        'name': name,
-                        'email': email,
-                        'phone': phone,
-                        'linkedin': linkedin,
-                        'github': github,
-                        'location': location,
-                        'summary': summary
-                    },
-                    'experience': experience_data,
-                    'education': education_data,
-                    'technical_skills': [skill.strip() for skill in technical_skills.split(',') if skill.strip()],
-                    'soft_skills': [skill.strip() for skill in soft_skills.split(',') if skill.strip()],
-                    'projects': projects_data,
-                    'certifications': [cert.strip() for cert in certifications.split(',') if cert.strip()],
-                    'languages': [lang.strip() for lang in languages.split(',') if lang.strip()]
-                }
-                
-                st.success("✅ Resume data saved successfully!")
-                
-                # Generate AI suggestions
-                with st.spinner("🤖 Generating AI analysis and suggestions..."):
-                    try:
-                        st.session_state.ai_analysis = get_ai_suggestions(st.session_state.resume_data)
-                        st.success("🎯 AI analysis complete! Check the 'Preview & AI' page.")
-                    except Exception as e:
-                        st.error(f"❌ AI analysis failed: {str(e)}")
-                        # Provide fallback suggestions
-                        st.session_state.ai_analysis = {
-                            'ats_score': 70,
-                            'suggestions': {
-                                'overall_feedback': [
-                                    "Add more quantifiable achievements to your experience section",
-                                    "Include specific technical skills relevant to your target roles",
-                                    "Use action verbs and focus on accomplishments rather than responsibilities"
-                                ]
-                            }
-                        }
-
 def show_templates():
     st.title("🎨 Resume Templates")
     st.markdown("---")
@@ -497,6 +129,15 @@ def show_templates():
     
     templates = get_all_templates()
     
+    # Thumbnails are cached per template version and data, so only stale ones re-render
+    use_my_data = st.toggle("Preview with my resume data", key="gallery_user_data")
+    if use_my_data:
+        thumbnails = gallery_thumbnails(st.session_state.resume_data)
+    else:
+        thumbnails = gallery_thumbnails()
+        # Warm the user's thumbnails in the background so flipping the toggle is instant
+        prerender_gallery(st.session_state.resume_data)
+    
     # Display templates in columns
     cols = st.columns(3)
     
@@ -509,6 +150,7 @@ def show_templates():
                 <div style="font-size: 2rem;">{template_info['preview']}</div>
             </div>
             """, unsafe_allow_html=True)
+            st.components.v1.html(thumbnails[template_id], height=THUMBNAIL_HEIGHT)
             
             if st.button(f"Select {template_info['name']}", key=template_id, use_container_width=True):
                 st.session_state.selected_template = template_id
@@ -591,16 +233,18 @@ def show_resume_preview():
 
 def show_ai_analysis():
     st.header("🤖 AI-Powered Resume Analysis")
+    st.caption(f"⚡ Instant offline ATS score: {score_resume(st.session_state.resume_data)['ats_score']}/100")
     
     if 'ai_analysis' not in st.session_state:
         st.info("💡 Click the button below to generate AI analysis for your resume")
-        if st.button("🔄 Generate AI Analysis", type="primary"):
-            with st.spinner("🤖 Analyzing your resume with AI..."):
-                st.session_state.ai_analysis = get_ai_suggestions(st.session_state.resume_data)
+        if not st.button("🔄 Generate AI Analysis", type="primary"):
+            return
+        st.session_state.ai_analysis = stream_ai_analysis(st.session_state.resume_data)
+        if not is_offline_analysis(st.session_state.ai_analysis):
             st.success("✅ AI analysis complete!")
-        return
     
     analysis = st.session_state.ai_analysis
+    show_offline_notice(analysis)
     
     # Display ATS Score
     st.subheader("📊 ATS Compatibility Score")
@@ -630,12 +274,30 @@ def show_ai_analysis():
             st.write(f"• {suggestion}")
     
     with st.expander("🔑 Keyword Optimization"):
-        st.info("Consider adding these keywords to improve ATS compatibility:")
-        keywords = suggestions.get('missing_keywords', [])
-        if keywords:
-            cols = st.columns(3)
-            for i, keyword in enumerate(keywords[:6]):
-                cols[i % 3].warning(f"`{keyword}`")
+        job_description = st.text_area(
+            "Paste a job description to compare keywords",
+            key="keyword_job_description",
+            height=150
+        )
+        if job_description.strip():
+            # Matched locally against the skills taxonomy, no AI round-trip needed
+            gap = keyword_gap(st.session_state.resume_data, job_description)
+            total = len(gap['matched']) + len(gap['missing'])
+            st.metric("Keyword Match", f"{len(gap['matched'])}/{total}")
+            if gap['missing']:
+                st.info("Add these keywords from the job description:")
+                cols = st.columns(3)
+                for i, keyword in enumerate(gap['missing']):
+                    cols[i % 3].warning(f"`{keyword}`")
+            if gap['matched']:
+                st.success(f"Already covered: {', '.join(gap['matched'])}")
+        else:
+            st.info("Consider adding these keywords to improve ATS compatibility:")
+            keywords = suggestions.get('missing_keywords', [])
+            if keywords:
+                cols = st.columns(3)
+                for i, keyword in enumerate(keywords[:6]):
+                    cols[i % 3].warning(f"`{keyword}`")
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
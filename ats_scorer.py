@@ -0,0 +1,144 @@
+import re
+from typing import Dict, Iterable, List, Optional, Tuple
+from utils.keyword_index import get_keyword_index, resume_text
+
+# Weights of (keywords, completeness, quantification, action verbs, length); sum to 1
+WEIGHTS = (0.25, 0.25, 0.2, 0.15, 0.15)
+
+# Keywords recruiters' ATS filters commonly look for when no job description is given
+DEFAULT_KEYWORDS = (
+    'Leadership', 'Project Management', 'Communication', 'Collaboration', 'Strategy',
+    'Data Analysis', 'Performance Optimization', 'Agile', 'Stakeholder Management',
+    'Automation', 'Testing', 'System Design', 'Mentoring', 'Budgeting', 'Problem Solving'
+)
+# Matching this many target keywords earns the full keyword score
+KEYWORD_TARGET = 8
+
+ACTION_VERBS = frozenset((
+    'achieved', 'accelerated', 'analyzed', 'architected', 'automated', 'built', 'championed',
+    'collaborated', 'created', 'cut', 'decreased', 'delivered', 'designed', 'developed',
+    'drove', 'eliminated', 'established', 'executed', 'expanded', 'generated', 'grew',
+    'implemented', 'improved', 'increased', 'launched', 'led', 'managed', 'mentored',
+    'migrated', 'negotiated', 'optimized', 'orchestrated', 'owned', 'pioneered', 'reduced',
+    'redesigned', 'refactored', 'resolved', 'scaled', 'shipped', 'spearheaded', 'streamlined',
+    'supervised', 'trained', 'transformed'
+))
+
+REQUIRED_FIELDS = (
+    ('personal_info', 'name'), ('personal_info', 'email'), ('personal_info', 'phone'),
+    ('personal_info', 'location'), ('personal_info', 'summary'), ('experience', None),
+    ('education', None), ('technical_skills', None), ('projects', None)
+)
+
+# Word counts that fit one to two pages
+IDEAL_WORDS = (350, 900)
+
+WORD_RE = re.compile(r"[a-z0-9+#./-]+")
+METRIC_RE = re.compile(r'\d|%|\$')
+BULLET_SPLIT_RE = re.compile(r'\n+|(?:^|\s)[•●▪◦‣*-]\s+')
+
+def _bullets(entries: Iterable[Dict]) -> List[str]:
+    bullets = []
+    for entry in entries:
+        for bullet in BULLET_SPLIT_RE.split(entry.get('description', '') or ''):
+            bullet = bullet.strip(' •●▪◦‣*-\t')
+            if bullet:
+                bullets.append(bullet)
+    return bullets
+
+def _length_score(word_count: int) -> float:
+    low, high = IDEAL_WORDS
+    if word_count < low:
+        return word_count / low
+    if word_count > high:
+        return max(0.0, 1 - (word_count - high) / high)
+    return 1.0
+
+def resume_features(resume_data: Dict, keywords: Optional[Iterable[str]] = None) -> Tuple[Tuple[float, ...], Dict]:
+    """Component scores in WEIGHTS order, each in [0, 1], plus the details behind them"""
+    text = resume_text(resume_data)
+    words = WORD_RE.findall(text.lower())
+
+    # Keywords are compared by canonical skill, so 'k8s' in the resume satisfies 'Kubernetes'
+    index = get_keyword_index()
+    skills = {skill.lower() for skill in index.scan(text)} | set(words)
+    targets = tuple(keywords or DEFAULT_KEYWORDS)
+    matched = [keyword for keyword in targets if index.canonical(keyword).lower() in skills]
+    missing = [keyword for keyword in targets if keyword not in matched]
+    target_count = min(KEYWORD_TARGET, len(targets)) if keywords is None else len(targets)
+
+    present = [
+        bool(resume_data.get(section, {}).get(field)) if field else bool(resume_data.get(section))
+        for section, field in REQUIRED_FIELDS
+    ]
+
+    bullets = _bullets(resume_data.get('experience', [])) + _bullets(resume_data.get('projects', []))
+    quantified = sum(1 for bullet in bullets if METRIC_RE.search(bullet))
+    action_led = sum(1 for bullet in bullets if bullet.split(None, 1)[0].lower().strip('.,:;') in ACTION_VERBS)
+
+    features = (
+        min(1.0, len(matched) / target_count) if target_count else 1.0,
+        sum(present) / len(present),
+        quantified / len(bullets) if bullets else 0.0,
+        action_led / len(bullets) if bullets else 0.0,
+        _length_score(len(words))
+    )
+    details = {
+        'matched_keywords': matched,
+        'missing_keywords': missing,
+        'missing_fields': [f"{section}.{field}" if field else section
+                           for (section, field), ok in zip(REQUIRED_FIELDS, present) if not ok],
+        'bullets': len(bullets),
+        'quantified_bullets': quantified,
+        'action_verb_bullets': action_led,
+        'word_count': len(words)
+    }
+    return features, details
+
+def score_resume(resume_data: Dict, keywords: Optional[Iterable[str]] = None) -> Dict:
+    """Deterministic, offline ATS analysis in the same shape as the AI analysis"""
+    features, details = resume_features(resume_data, keywords)
+    score = round(100 * sum(weight * feature for weight, feature in zip(WEIGHTS, features)))
+    keyword_score, completeness, quantification, action_verbs, length = features
+
+    overall_feedback = []
+    if completeness < 1:
+        overall_feedback.append(f"Complete the missing sections: {', '.join(details['missing_fields'])}")
+    if quantification < 0.5:
+        overall_feedback.append(
+            f"Only {details['quantified_bullets']} of {details['bullets']} bullets include numbers - "
+            "quantify impact with metrics, percentages or amounts"
+        )
+    if action_verbs < 0.6:
+        overall_feedback.append("Start each bullet with a strong action verb such as 'led', 'built' or 'reduced'")
+    if keyword_score < 1:
+        overall_feedback.append(f"Work in relevant keywords such as {', '.join(details['missing_keywords'][:3])}")
+    if length < 1:
+        if details['word_count'] < IDEAL_WORDS[0]:
+            overall_feedback.append(f"At {details['word_count']} words the resume is thin - aim for {IDEAL_WORDS[0]}+")
+        else:
+            overall_feedback.append(f"At {details['word_count']} words the resume is long - trim to under {IDEAL_WORDS[1]}")
+    if not overall_feedback:
+        overall_feedback.append("Strong ATS fundamentals - tailor keywords to each job description")
+
+    personal_info = resume_data.get('personal_info', {})
+    section_feedback = {
+        'personal_info': (["Add a professional summary with your target role and key skills"]
+                          if not personal_info.get('summary') else
+                          ["Keep the summary to 2-3 keyword-rich sentences"]),
+        'experience': (["Add your work experience with dated roles"] if not resume_data.get('experience') else
+                       [f"{details['quantified_bullets']}/{details['bullets']} bullets are quantified; "
+                        f"{details['action_verb_bullets']}/{details['bullets']} start with an action verb"]),
+        'skills': (["List your technical skills"] if not resume_data.get('technical_skills') else
+                   ["Mirror the exact skill names used in job postings"])
+    }
+
+    return {
+        'ats_score': score,
+        'suggestions': {
+            'overall_feedback': overall_feedback,
+            'section_feedback': section_feedback,
+            'missing_keywords': details['missing_keywords']
+        },
+        'improved_content': resume_data
+    }
@@ -0,0 +1,64 @@
+"""Throughput of batch resume analysis against a mock server with injected latency.
+
+Compares the sequential analyze_resume loop with AISuggestionsEngine.analyze_many
+at several concurrency limits. Every resume is distinct so the analysis cache
+never short-circuits a request.
+
+    python benchmarks/bench_batch_analysis.py --resumes 100 --latency 0.2
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_openai_server import MockOpenAIServer
+
+def make_resumes(count: int, run: str) -> list:
+    return [
+        {
+            'personal_info': {'name': f'Candidate {run}-{index}', 'summary': 'Data engineer'},
+            'experience': [{'title': 'Engineer', 'company': f'Company {index}'}],
+            'technical_skills': ['Python', 'Spark']
+        }
+        for index in range(count)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--resumes", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds the mock server waits per request")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as cache_dir, MockOpenAIServer(latency=args.latency) as server:
+        os.environ['OPENAI_API_KEY'] = 'sk-benchmark'
+        os.environ['OPENAI_BASE_URL'] = server.base_url
+        os.environ['NEURACV_ANALYSIS_CACHE_PATH'] = os.path.join(cache_dir, 'analysis.sqlite3')
+        from utils.ai_suggestions import get_engine
+
+        engine = get_engine()
+        print(f"{args.resumes} resumes, {args.latency * 1000:.0f} ms injected latency")
+
+        if not args.skip_sequential:
+            resumes = make_resumes(args.resumes, 'sequential')
+            started = time.perf_counter()
+            for resume_data in resumes:
+                engine.analyze_resume(resume_data)
+            elapsed = time.perf_counter() - started
+            print(f"{'sequential':<16} {elapsed:7.2f} s   {args.resumes / elapsed:8.1f} resumes/s")
+
+        for concurrency in args.concurrency:
+            resumes = make_resumes(args.resumes, f'batch-{concurrency}')
+            started = time.perf_counter()
+            results = engine.analyze_many(resumes, concurrency=concurrency)
+            elapsed = time.perf_counter() - started
+            errors = sum(1 for result in results if result['error'])
+            print(f"{'concurrency ' + str(concurrency):<16} {elapsed:7.2f} s   "
+                  f"{args.resumes / elapsed:8.1f} resumes/s   errors {errors}")
+
+if __name__ == "__main__":
+    main()
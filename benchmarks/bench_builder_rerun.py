@@ -0,0 +1,110 @@
+"""Rerun latency of the Build Resume page with many entries, full page versus fragment.
+
+Drives the builder with streamlit's AppTest. An edit normally reruns the whole page in
+AppTest, so for the fragment case the benchmark queues the fragment that owns the edited
+widget, the way the browser does for an edit inside an st.fragment. Reports the wall time
+of each rerun (script run plus the deltas it sends) and how many widgets it re-rendered.
+
+    python benchmarks/bench_builder_rerun.py --entries 30
+"""
+import argparse
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def make_resume(entries: int) -> dict:
+    return {
+        'personal_info': {'name': 'Candidate', 'email': 'candidate@example.com', 'summary': 'Engineer'},
+        'experience': [
+            {'title': f'Engineer {index}', 'company': f'Company {index}', 'start_date': '2020',
+             'description': '• Built services handling 2M requests/day\n• Cut latency 40%'}
+            for index in range(entries)
+        ],
+        'education': [{'degree': f'Degree {index}', 'institution': 'University'} for index in range(entries)],
+        'projects': [{'name': f'Project {index}', 'description': 'Internal tooling'} for index in range(entries)],
+        'technical_skills': ['Python', 'Kubernetes']
+    }
+
+def builder_page():
+    from utils.resume_builder import show_build_resume
+    show_build_resume()
+
+class FragmentReruns:
+    """Hooks AppTest's script runner to capture each run's deltas and to queue fragment reruns"""
+
+    def __init__(self):
+        from streamlit.testing.v1 import local_script_runner
+
+        self.messages = []
+        self.fragment_ids = []
+        parse_tree = local_script_runner.parse_tree_from_messages
+        rerun_data = local_script_runner.RerunData
+
+        def capture(messages):
+            self.messages = list(messages)
+            return parse_tree(messages)
+
+        def queue_fragments(**kwargs):
+            if self.fragment_ids:
+                kwargs['fragment_id_queue'] = list(self.fragment_ids)
+            return rerun_data(**kwargs)
+
+        local_script_runner.parse_tree_from_messages = capture
+        local_script_runner.RerunData = queue_fragments
+
+    def fragment_of(self, widget_key: str) -> str:
+        """Id of the fragment that rendered the widget with this key in the last run"""
+        for message in self.messages:
+            if message.WhichOneof('type') != 'delta' or message.delta.WhichOneof('type') != 'new_element':
+                continue
+            element = message.delta.new_element
+            if widget_key in getattr(getattr(element, element.WhichOneof('type')), 'id', ''):
+                return message.delta.fragment_id
+        raise LookupError(widget_key)
+
+def timed_run(app) -> float:
+    started = time.perf_counter()
+    app.run()
+    return (time.perf_counter() - started) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=30, help="experience, education and project entries each")
+    parser.add_argument("--edits", type=int, default=10)
+    args = parser.parse_args()
+
+    from streamlit.testing.v1 import AppTest
+
+    with tempfile.TemporaryDirectory() as directory:
+        os.environ['NEURACV_DRAFT_DB_PATH'] = os.path.join(directory, 'drafts.sqlite3')
+        reruns = FragmentReruns()
+        app = AppTest.from_function(builder_page, default_timeout=120)
+        app.session_state.resume_data = make_resume(args.entries)
+        app.run()
+        fragment_id = reruns.fragment_of("exp_title_0")
+
+        full, fragment, widgets = [], [], {}
+        for edit in range(args.edits):
+            app.text_input(key="exp_title_0").input(f"Full {edit}")
+            full.append(timed_run(app))
+            widgets['full'] = len(app.text_input) + len(app.text_area)
+
+            app.text_input(key="exp_title_0").input(f"Fragment {edit}")
+            reruns.fragment_ids = [fragment_id]
+            fragment.append(timed_run(app))
+            reruns.fragment_ids = []
+            widgets['fragment'] = len(app.text_input) + len(app.text_area)
+            assert app.session_state.resume_data['experience'][0]['title'] == f"Fragment {edit}"
+
+    print(f"{args.entries} experience, education and project entries; median of {args.edits} edits")
+    print(f"  full page rerun   {statistics.median(full):7.1f} ms, {widgets['full']} widgets")
+    print(f"  fragment rerun    {statistics.median(fragment):7.1f} ms, {widgets['fragment']} widgets")
+    print(f"editing one entry is {statistics.median(full) / statistics.median(fragment):.0f}x faster as a fragment rerun")
+
+if __name__ == "__main__":
+    main()
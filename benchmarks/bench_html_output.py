@@ -0,0 +1,72 @@
+"""Preview and download payload sizes before and after the HTML output stage.
+
+"raw" is what render_template returns and what every rerun used to send to the
+preview iframe. "minified" is the self-contained download. "preview" is what a rerun
+sends once the stylesheet is a static asset, with the asset size listed separately
+since the browser fetches it once. Also times minification on a cache miss and hit.
+
+    python benchmarks/bench_html_output.py --entries 5
+"""
+import argparse
+import gzip
+import os
+import sys
+import tempfile
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+def make_resume(entries: int) -> dict:
+    return {
+        'personal_info': {'name': 'Candidate', 'email': 'candidate@example.com', 'phone': '555-0100',
+                          'location': 'Remote', 'summary': 'Backend engineer focused on reliable systems.'},
+        'experience': [
+            {'title': f'Engineer {index}', 'company': f'Company {index}', 'start_date': '2020',
+             'description': '• Built services handling 2M requests/day\n• Cut latency 40%'}
+            for index in range(entries)
+        ],
+        'education': [{'degree': 'BSc Computer Science', 'institution': 'University', 'year': '2019'}],
+        'projects': [{'name': f'Project {index}', 'description': 'Internal tooling'} for index in range(entries)],
+        'technical_skills': ['Python', 'Kubernetes', 'PostgreSQL', 'Kafka', 'AWS']
+    }
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entries", type=int, default=5, help="experience and project entries")
+    parser.add_argument("--repeat", type=int, default=200)
+    args = parser.parse_args()
+
+    from utils import html_output
+    from utils.template_engine import get_all_templates, render_template, render_template_to_file
+
+    # As configured in .streamlit/config.toml, which only `streamlit run` reads
+    html_output.static_serving_enabled = lambda: True
+    html_output.CSS_ASSET_DIR = tempfile.mkdtemp()
+    resume = make_resume(args.entries)
+
+    print(f"{'template':<14}{'raw':>9}{'minified':>10}{'gzipped':>9}{'preview':>9}{'css asset':>11}")
+    for template_name in get_all_templates():
+        raw = render_template(template_name, resume)
+        minified = html_output.minify_html(raw)
+        preview = html_output.preview_html(raw)
+        compressed = render_template_to_file(template_name, resume, minify=True, compress=True).getvalue()
+        style = html_output._STYLE_RE.search(minified)
+        asset = len(style.group(1).encode()) if style else 0
+        print(f"{template_name:<14}{len(raw.encode()):>9}{len(minified.encode()):>10}{len(compressed):>9}"
+              f"{len(preview.encode()):>9}{asset:>11}")
+
+    raw = render_template(next(iter(get_all_templates())), resume)
+    started = time.perf_counter()
+    for index in range(args.repeat):
+        html_output.minify_html(raw + f"<!-- {index} -->")
+    miss = (time.perf_counter() - started) / args.repeat
+    started = time.perf_counter()
+    for _ in range(args.repeat):
+        html_output.preview_html(raw)
+    hit = (time.perf_counter() - started) / args.repeat
+    print(f"minify: {miss * 1000:.3f} ms on a miss, preview {hit * 1000:.3f} ms on a hit")
+    print(f"gzip of raw for comparison: {len(gzip.compress(raw.encode()))} bytes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Cold-start import time of each Streamlit page, measured with python -X importtime.
+
+Every page's top-level imports run in a fresh interpreter after `import streamlit`,
+so the numbers are what a new worker pays for that page on top of Streamlit itself.
+Reports the median over several runs and the heaviest modules pulled in.
+
+    python benchmarks/bench_import_time.py --runs 5
+"""
+import argparse
+import ast
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = ("app.py", "1_Build_Resume.py", "2_Preview.py", "3_Templates.py", "4_Job_Match.py")
+
+def page_imports(page: str) -> str:
+    """The page's module-level import statements as source"""
+    with open(os.path.join(ROOT, page), encoding='utf-8') as f:
+        tree = ast.parse(f.read())
+    return "\n".join(ast.unparse(node) for node in tree.body if isinstance(node, (ast.Import, ast.ImportFrom)))
+
+def import_times(source: str) -> list:
+    """(name, depth, cumulative microseconds) for each module first imported by source after streamlit"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import streamlit\n{source}"],
+        cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT), capture_output=True, text=True, check=True
+    )
+    entries, after_streamlit = [], False
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if after_streamlit:
+            entries.append((name.strip(), (len(name) - len(name.lstrip()) - 1) // 2, int(cumulative)))
+        elif name.strip() == "streamlit":
+            after_streamlit = True
+    return entries
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=5, help="heaviest modules to list per page")
+    args = parser.parse_args()
+
+    for page in PAGES:
+        source = page_imports(page)
+        totals, last = [], []
+        for _ in range(args.runs):
+            last = import_times(source)
+            totals.append(sum(cumulative for _, depth, cumulative in last if depth == 0))
+        print(f"{page:<20} {statistics.median(totals) / 1000:7.1f} ms beyond streamlit")
+        # Second-level modules show which heavy dependency a utils module drags in
+        heaviest = sorted((entry for entry in last if entry[1] <= 1), key=lambda entry: -entry[2])
+        for name, depth, cumulative in heaviest[:args.top]:
+            print(f"    {'  ' * depth}{name:<36} {cumulative / 1000:7.1f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Build, reload and ranking time of the TF-IDF job index on a synthetic corpus.
+
+Postings are drawn from the skills taxonomy plus a filler vocabulary, so the matrix
+has a realistic number of non-zeros per row. Reload time covers memory-mapping the
+saved arrays; ranking time is one resume against every posting.
+
+    python benchmarks/bench_job_matcher.py --jobs 50000
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+def make_postings(count: int, seed: int = 7) -> list:
+    from utils.keyword_index import SKILLS_TAXONOMY
+
+    rng = random.Random(seed)
+    skills = [synonym for synonyms in SKILLS_TAXONOMY.values() for synonym in synonyms]
+    filler = [f"term{index}" for index in range(20000)]
+    titles = ['Backend Engineer', 'Data Scientist', 'Frontend Developer', 'DevOps Engineer', 'Product Manager']
+    return [
+        {
+            'id': index,
+            'title': rng.choice(titles),
+            'company': f"Company {index % 997}",
+            'description': ' '.join(rng.sample(skills, 12) + rng.sample(filler, 150))
+        }
+        for index in range(count)
+    ]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--jobs", type=int, default=50000)
+    parser.add_argument("--top-k", type=int, default=10)
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    from utils.job_matcher import JobMatcher
+
+    postings = make_postings(args.jobs)
+    resume = "Senior backend engineer: Python, k8s, PostgreSQL, Kafka, AWS, CI/CD, led a team of five " * 3
+
+    with tempfile.TemporaryDirectory() as directory:
+        index_dir = os.path.join(directory, 'job_index')
+        started = time.perf_counter()
+        matcher = JobMatcher.build(postings)
+        matcher.save(index_dir)
+        build_time = time.perf_counter() - started
+        print(f"{args.jobs} postings, {len(matcher.terms)} terms, {matcher.matrix.nnz} non-zeros")
+        print(f"build + save: {build_time:.2f} s")
+
+        started = time.perf_counter()
+        matcher = JobMatcher.load(index_dir)
+        print(f"reload (mmap): {(time.perf_counter() - started) * 1000:.1f} ms")
+
+        timings = []
+        for _ in range(args.repeat):
+            started = time.perf_counter()
+            results = matcher.rank(resume, args.top_k)
+            timings.append(time.perf_counter() - started)
+        print(f"rank: median {statistics.median(timings) * 1000:.1f} ms, "
+              f"best {min(timings) * 1000:.1f} ms over {args.repeat} runs")
+        best = results[0]
+        print(f"top match: {best['title']} at {best['company']} ({best['score']:.3f}, {', '.join(best['matched_terms'])})")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""Per-call latency of a fresh OpenAI client vs the shared, pooled engine.
+
+Runs sequential analyses against a local stand-in server, so the difference is
+connection setup alone. Against the real API the fresh-client path also pays
+DNS and a TLS handshake on every call.
+
+    python benchmarks/bench_openai_pool.py --calls 200
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from mock_openai_server import MockOpenAIServer
+
+RESUME = {
+    'personal_info': {'name': 'Jane Doe', 'summary': 'Backend engineer'},
+    'experience': [{'title': 'Engineer', 'company': 'Acme', 'description': 'Built APIs'}],
+    'technical_skills': ['Python', 'PostgreSQL']
+}
+
+def measure(analyze, calls: int) -> list:
+    samples = []
+    for _ in range(calls):
+        started = time.perf_counter()
+        analyze(RESUME)
+        samples.append((time.perf_counter() - started) * 1000)
+    return samples
+
+def report(label: str, samples: list, connections: int) -> None:
+    samples = sorted(samples)
+    p95 = samples[int(len(samples) * 0.95) - 1]
+    print(f"{label:<14} median {statistics.median(samples):6.2f} ms   p95 {p95:6.2f} ms   connections {connections}")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=200)
+    args = parser.parse_args()
+
+    with MockOpenAIServer() as server:
+        os.environ['OPENAI_API_KEY'] = 'sk-benchmark'
+        os.environ['OPENAI_BASE_URL'] = server.base_url
+        from utils.ai_suggestions import AISuggestionsEngine, get_engine
+
+        def fresh_engine(resume_data):
+            engine = AISuggestionsEngine()
+            try:
+                return engine._request_analysis(resume_data)
+            finally:
+                engine.client.close()
+
+        shared = get_engine()
+        # Warm the shared pool so the comparison is steady state
+        shared._request_analysis(RESUME)
+
+        before = server.connections
+        fresh = measure(fresh_engine, args.calls)
+        fresh_connections = server.connections - before
+
+        before = server.connections
+        pooled = measure(shared._request_analysis, args.calls)
+        pooled_connections = server.connections - before
+
+    print(f"{args.calls} sequential analyses against {server.base_url}")
+    report("fresh client", fresh, fresh_connections)
+    report("shared engine", pooled, pooled_connections)
+    saved = statistics.median(fresh) - statistics.median(pooled)
+    print(f"saved per call: {saved:.2f} ms")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""PDF exports per second under concurrent users, cold renderer versus the warm pool.
+
+"cold" starts a fresh interpreter per export, so it pays the weasyprint import, font
+discovery and CSS parsing every time, the way a one-shot export would. "warm" sends the
+same documents through pdf_export's pre-initialized renderer processes. Every document is
+distinct so neither side is helped by the PDF cache; the last line shows a cache hit.
+
+    python benchmarks/bench_pdf_export.py --exports 40 --concurrency 1 4 8
+"""
+import argparse
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+COLD_RENDER = (
+    "import sys\n"
+    "from weasyprint import CSS, HTML\n"
+    "from utils.pdf_export import PDF_BASE_CSS\n"
+    "sys.stdout.buffer.write(HTML(string=sys.stdin.read()).write_pdf(stylesheets=[CSS(string=PDF_BASE_CSS)]))\n"
+)
+
+def make_resume(index: int) -> dict:
+    return {
+        'personal_info': {'name': f'Candidate {index}', 'email': f'c{index}@example.com',
+                          'summary': 'Backend engineer focused on reliable distributed systems. ' * 3},
+        'experience': [
+            {'title': 'Engineer', 'company': f'Company {job}', 'start_date': '2020', 'end_date': 'Present',
+             'description': '• Built services handling 2M requests/day\n• Cut latency 40%\n' * 3}
+            for job in range(4)
+        ],
+        'education': [{'degree': 'BSc Computer Science', 'institution': 'University', 'graduation_date': '2019'}],
+        'technical_skills': ['Python', 'Kubernetes', 'PostgreSQL', 'Kafka', 'AWS'],
+        'projects': [{'name': 'Tooling', 'description': 'Internal developer platform ' * 10}]
+    }
+
+def cold_export(html: str) -> bytes:
+    result = subprocess.run(
+        [sys.executable, "-c", COLD_RENDER], input=html.encode('utf-8'), capture_output=True,
+        cwd=ROOT, env=dict(os.environ, PYTHONPATH=ROOT), check=True
+    )
+    return result.stdout
+
+def throughput(export, documents: list, concurrency: int) -> float:
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as clients:
+        list(clients.map(export, documents))
+    return len(documents) / (time.perf_counter() - started)
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--exports", type=int, default=40, help="exports per run")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 8])
+    parser.add_argument("--template", default="professional")
+    parser.add_argument("--skip-cold", action="store_true")
+    args = parser.parse_args()
+
+    os.environ['NEURACV_PDF_CACHE_DIR'] = tempfile.mkdtemp()
+    from utils import pdf_export
+    from utils.template_engine import render_template
+
+    if not pdf_export.pdf_available():
+        sys.exit("weasyprint is not installed")
+
+    started = time.perf_counter()
+    pdf_export.warm_pdf_pool()
+    print(f"pool of {pdf_export.PDF_WORKERS} renderers warmed in {(time.perf_counter() - started) * 1000:.0f} ms")
+
+    run = 0
+    for concurrency in args.concurrency:
+        row = []
+        for name, export in (("cold", cold_export), ("warm", pdf_export.html_to_pdf)):
+            if name == "cold" and args.skip_cold:
+                continue
+            documents = [render_template(args.template, make_resume(run * args.exports + index))
+                         for index in range(args.exports)]
+            run += 1
+            row.append(f"{name} {throughput(export, documents, concurrency):6.1f}/s")
+        print(f"concurrency {concurrency:>2}: {'  '.join(row)}")
+
+    html = render_template(args.template, make_resume(0))
+    pdf_export.html_to_pdf(html)
+    started = time.perf_counter()
+    pdf = pdf_export.html_to_pdf(html)
+    print(f"cache hit: {(time.perf_counter() - started) * 1000:.2f} ms for a {len(pdf) / 1024:.0f} KiB PDF")
+    pdf_export.shutdown_pdf_pool()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+"""Serial vs process-pool PDF page extraction across document lengths.
+
+Generates synthetic multi-page CVs and times utils.resume_parser.iter_pdf_pages
+with one worker and with a pool, to find where the pool starts paying off.
+The crossover informs NEURACV_PARALLEL_MIN_PAGES.
+
+    python benchmarks/bench_pdf_parallel.py --workers 4 --pages 1 2 4 8 16 32 64
+"""
+import argparse
+import io
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.resume_parser import iter_pdf_pages
+
+LINES_PER_PAGE = 45
+
+def build_pdf(page_count: int) -> bytes:
+    """Minimal uncompressed PDF with a page of Helvetica text per page"""
+    objects = [b"<< /Type /Catalog /Pages 2 0 R >>", None, b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    page_refs = []
+    for page in range(page_count):
+        lines = [f"Senior Research Engineer, Lab {page}-{line} | Jan 2015 - Dec 2019 | published 12 papers, led 4 grants"
+                 for line in range(LINES_PER_PAGE)]
+        text = " T* ".join(f"({line}) Tj" for line in lines)
+        stream = f"BT /F1 9 Tf 12 TL 40 800 Td {text} ET".encode('latin-1')
+        objects.append(b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream))
+        content_ref = len(objects)
+        objects.append(
+            b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 842] "
+            b"/Resources << /Font << /F1 3 0 R >> >> /Contents %d 0 R >>" % content_ref
+        )
+        page_refs.append(len(objects))
+    kids = b" ".join(b"%d 0 R" % ref for ref in page_refs)
+    objects[1] = b"<< /Type /Pages /Kids [%s] /Count %d >>" % (kids, page_count)
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(out.tell())
+        out.write(b"%d 0 obj\n%s\nendobj\n" % (number, body))
+    xref = out.tell()
+    out.write(b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1))
+    for offset in offsets:
+        out.write(b"%010d 00000 n \n" % offset)
+    out.write(b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref))
+    return out.getvalue()
+
+def time_extraction(pdf_bytes: bytes, workers: int, repeat: int) -> float:
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        for _ in iter_pdf_pages(io.BytesIO(pdf_bytes), workers=workers):
+            pass
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples) * 1000
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--workers", type=int, default=min(4, os.cpu_count() or 1))
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 2, 4, 8, 12, 16, 24, 32, 40, 64])
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    # Force the pool on for every size so the crossover is visible
+    import utils.resume_parser as resume_parser
+    resume_parser.PARALLEL_MIN_PAGES = 1
+
+    print(f"{'pages':>5}  {'serial ms':>10}  {'pool ms':>10}  {'speedup':>7}")
+    crossover = None
+    for page_count in args.pages:
+        pdf_bytes = build_pdf(page_count)
+        serial = time_extraction(pdf_bytes, 1, args.repeat)
+        parallel = time_extraction(pdf_bytes, args.workers, args.repeat)
+        if crossover is None and parallel < serial:
+            crossover = page_count
+        print(f"{page_count:>5}  {serial:>10.1f}  {parallel:>10.1f}  {serial / parallel:>6.2f}x")
+
+    print(f"pool with {args.workers} workers first wins at: {crossover or 'never'} pages")
+
+if __name__ == "__main__":
+    main()
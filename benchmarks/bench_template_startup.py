@@ -0,0 +1,66 @@
+"""Cold-start render latency with and without precompiled templates.
+
+Each trial starts a fresh interpreter, imports the template engine and renders
+one preview, which is what a newly scaled-out worker does on its first request.
+
+    python benchmarks/bench_template_startup.py --trials 10
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = """
+import time
+started = time.perf_counter()
+from utils.template_engine import render_template
+imported = time.perf_counter()
+render_template('professional', {'personal_info': {'name': 'Jane Doe'}, 'experience': [{'title': 'Engineer'}]})
+rendered = time.perf_counter()
+print(f"{(imported - started) * 1000:.3f} {(rendered - imported) * 1000:.3f}")
+"""
+
+def run_trial(cache_dir: str) -> tuple:
+    env = dict(os.environ, NEURACV_TEMPLATE_CACHE_DIR=cache_dir)
+    output = subprocess.run(
+        [sys.executable, "-c", CHILD], cwd=ROOT, env=env,
+        check=True, capture_output=True, text=True
+    ).stdout.split()
+    return float(output[0]), float(output[1])
+
+def precompile(cache_dir: str) -> None:
+    env = dict(os.environ, NEURACV_TEMPLATE_CACHE_DIR=cache_dir)
+    subprocess.run([sys.executable, "-m", "utils.template_engine"], cwd=ROOT, env=env, check=True, capture_output=True)
+
+def report(label: str, samples: list) -> None:
+    imports = [sample[0] for sample in samples]
+    renders = [sample[1] for sample in samples]
+    totals = [sample[0] + sample[1] for sample in samples]
+    print(f"{label:<14} import {statistics.median(imports):8.2f} ms   "
+          f"first render {statistics.median(renders):7.2f} ms   "
+          f"total {statistics.median(totals):8.2f} ms")
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--trials", type=int, default=10)
+    args = parser.parse_args()
+
+    cold = []
+    for _ in range(args.trials):
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cold.append(run_trial(cache_dir))
+
+    with tempfile.TemporaryDirectory() as cache_dir:
+        precompile(cache_dir)
+        warm = [run_trial(cache_dir) for _ in range(args.trials)]
+
+    print(f"median of {args.trials} fresh processes")
+    report("cold", cold)
+    report("precompiled", warm)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+"""Local stand-in for the OpenAI chat completions endpoint used by the benchmarks.
+
+Serves canned analyses over HTTP/1.1 with keep-alive, optionally sleeping to
+simulate model latency. Point the engine at it with OPENAI_BASE_URL.
+"""
+import json
+import socket
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+ANALYSIS = {
+    'ats_score': 82,
+    'suggestions': {
+        'overall_feedback': [
+            "Quantify the impact of your most recent role",
+            "Lead each bullet with a strong action verb"
+        ],
+        'section_feedback': {
+            'personal_info': ["Add a target job title to your summary"],
+            'experience': ["Trim responsibilities that repeat across roles"],
+            'skills': ["Group skills by category"]
+        },
+        'missing_keywords': ['kubernetes', 'ci/cd', 'stakeholder management']
+    },
+    'improved_content': {}
+}
+
+def _completion_body(content: str) -> dict:
+    return {
+        'id': 'chatcmpl-mock',
+        'object': 'chat.completion',
+        'created': int(time.time()),
+        'model': 'mock',
+        'choices': [{'index': 0, 'message': {'role': 'assistant', 'content': content}, 'finish_reason': 'stop'}],
+        'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0}
+    }
+
+def _chunk_body(delta: dict, finish_reason=None) -> dict:
+    return {
+        'id': 'chatcmpl-mock',
+        'object': 'chat.completion.chunk',
+        'created': int(time.time()),
+        'model': 'mock',
+        'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}]
+    }
+
+class _Server(ThreadingHTTPServer):
+    # The default backlog of 5 drops SYNs when a batch opens many connections at once
+    request_queue_size = 256
+
+class MockOpenAIServer:
+    """Threaded mock server; use as a context manager to run it in the background"""
+
+    def __init__(self, latency: float = 0.0, token_latency: float = 0.0, chunk_size: int = 8):
+        self.latency = latency
+        self.token_latency = token_latency
+        self.chunk_size = chunk_size
+        self.requests = 0
+        self.connections = 0
+        self._server = _Server(('127.0.0.1', 0), self._handler())
+        self._server.daemon_threads = True
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address
+        return f"http://{host}:{port}/v1"
+
+    def _handler(self):
+        mock = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                super().setup()
+                # Headers and body go out in separate writes; without this, Nagle plus
+                # delayed ACKs add ~40 ms to every response on a reused connection
+                self.request.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                mock.connections += 1
+
+            def log_message(self, *args):
+                pass
+
+            def do_POST(self):
+                length = int(self.headers.get('Content-Length', 0))
+                request = json.loads(self.rfile.read(length) or b'{}')
+                mock.requests += 1
+                if mock.latency:
+                    time.sleep(mock.latency)
+                content = json.dumps(ANALYSIS)
+                if request.get('stream'):
+                    self._stream(content)
+                else:
+                    self._send_json(_completion_body(content))
+
+            def _send_json(self, body: dict):
+                payload = json.dumps(body).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            def _stream(self, content: str):
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/event-stream')
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                events = [_chunk_body({'role': 'assistant', 'content': ''})]
+                events += [_chunk_body({'content': content[i:i + mock.chunk_size]})
+                           for i in range(0, len(content), mock.chunk_size)]
+                events.append(_chunk_body({}, finish_reason='stop'))
+                for event in events:
+                    self._write_chunk(f"data: {json.dumps(event)}\n\n".encode('utf-8'))
+                    if mock.token_latency:
+                        time.sleep(mock.token_latency)
+                self._write_chunk(b"data: [DONE]\n\n")
+                self.wfile.write(b"0\r\n\r\n")
+
+            def _write_chunk(self, data: bytes):
+                self.wfile.write(b"%x\r\n%s\r\n" % (len(data), data))
+                self.wfile.flush()
+
+        return Handler
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,209 @@
+import streamlit as st
+import copy
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+import zlib
+from typing import Dict, List, Optional
+from utils.ai_suggestions import is_offline_analysis
+from utils.cache import canonical_hash
+from utils.resume_model import Resume
+
+DRAFT_DB_PATH = os.getenv('NEURACV_DRAFT_DB_PATH', os.path.join("data", "drafts.sqlite3"))
+# Saved versions kept per draft, newest first
+DRAFT_HISTORY_LIMIT = int(os.getenv('NEURACV_DRAFT_HISTORY_LIMIT', '20'))
+DRAFT_QUERY_PARAM = 'draft'
+
+def _pack(value: Optional[Dict]) -> Optional[bytes]:
+    if value is None:
+        return None
+    return zlib.compress(json.dumps(value, ensure_ascii=False, separators=(',', ':')).encode('utf-8'), 6)
+
+def _unpack(blob: Optional[bytes]) -> Optional[Dict]:
+    if blob is None:
+        return None
+    return json.loads(zlib.decompress(blob).decode('utf-8'))
+
+class DraftStore:
+    """Versioned resume drafts and their latest analysis in a sqlite file shared by all Streamlit processes"""
+
+    def __init__(self, path: str = DRAFT_DB_PATH, history_limit: int = DRAFT_HISTORY_LIMIT):
+        self.path = path
+        self.history_limit = history_limit
+        self._local = threading.local()
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite connections must not be shared across threads
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Autocommit mode; writes open their own BEGIN IMMEDIATE transactions
+            connection = sqlite3.connect(self.path, timeout=10, isolation_level=None)
+            connection.execute("PRAGMA busy_timeout=10000")
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS drafts ("
+                "draft_id TEXT PRIMARY KEY, version INTEGER NOT NULL, updated_at REAL NOT NULL, "
+                "content_hash TEXT NOT NULL, resume BLOB NOT NULL, analysis BLOB)"
+            )
+            connection.execute(
+                "CREATE TABLE IF NOT EXISTS draft_history ("
+                "draft_id TEXT NOT NULL, version INTEGER NOT NULL, saved_at REAL NOT NULL, resume BLOB NOT NULL, "
+                "PRIMARY KEY (draft_id, version))"
+            )
+            self._local.connection = connection
+        return connection
+
+    def save(self, draft_id: str, resume_data: Dict, analysis: Optional[Dict] = None) -> int:
+        """Store resume_data as a new version (or just the analysis, if the resume is unchanged); returns the version"""
+        content_hash = Resume.from_dict(resume_data).content_hash
+        now = time.time()
+        connection = self._connection()
+        # IMMEDIATE takes the write lock up front, so concurrent savers queue on busy_timeout
+        # instead of failing when a read transaction tries to upgrade
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            row = connection.execute(
+                "SELECT version, content_hash FROM drafts WHERE draft_id = ?", (draft_id,)
+            ).fetchone()
+            if row is not None and row[1] == content_hash:
+                version = row[0]
+                connection.execute(
+                    "UPDATE drafts SET updated_at = ?, analysis = ? WHERE draft_id = ?",
+                    (now, _pack(analysis), draft_id)
+                )
+            else:
+                version = (row[0] if row else 0) + 1
+                resume_blob = _pack(resume_data)
+                connection.execute(
+                    "INSERT OR REPLACE INTO drafts (draft_id, version, updated_at, content_hash, resume, analysis) "
+                    "VALUES (?, ?, ?, ?, ?, ?)",
+                    (draft_id, version, now, content_hash, resume_blob, _pack(analysis))
+                )
+                connection.execute(
+                    "INSERT OR REPLACE INTO draft_history (draft_id, version, saved_at, resume) VALUES (?, ?, ?, ?)",
+                    (draft_id, version, now, resume_blob)
+                )
+                connection.execute(
+                    "DELETE FROM draft_history WHERE draft_id = ? AND version <= ?",
+                    (draft_id, version - self.history_limit)
+                )
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+        return version
+
+    def load(self, draft_id: str) -> Optional[Dict]:
+        """Latest version as {'resume_data', 'analysis', 'version', 'updated_at'}, or None"""
+        row = self._connection().execute(
+            "SELECT version, updated_at, resume, analysis FROM drafts WHERE draft_id = ?", (draft_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {
+            'resume_data': _unpack(row[2]),
+            'analysis': _unpack(row[3]),
+            'version': row[0],
+            'updated_at': row[1]
+        }
+
+    def history(self, draft_id: str) -> List[Dict]:
+        """Saved versions, newest first, without their content"""
+        rows = self._connection().execute(
+            "SELECT version, saved_at FROM draft_history WHERE draft_id = ? ORDER BY version DESC", (draft_id,)
+        ).fetchall()
+        return [{'version': version, 'saved_at': saved_at} for version, saved_at in rows]
+
+    def load_version(self, draft_id: str, version: int) -> Optional[Dict]:
+        row = self._connection().execute(
+            "SELECT resume FROM draft_history WHERE draft_id = ? AND version = ?", (draft_id, version)
+        ).fetchone()
+        return _unpack(row[0]) if row else None
+
+    def delete(self, draft_id: str) -> None:
+        connection = self._connection()
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            connection.execute("DELETE FROM drafts WHERE draft_id = ?", (draft_id,))
+            connection.execute("DELETE FROM draft_history WHERE draft_id = ?", (draft_id,))
+            connection.execute("COMMIT")
+        except BaseException:
+            connection.execute("ROLLBACK")
+            raise
+
+_draft_store = None
+_draft_store_lock = threading.Lock()
+
+def get_draft_store() -> DraftStore:
+    """Process-wide draft store"""
+    global _draft_store
+    if _draft_store is None:
+        with _draft_store_lock:
+            if _draft_store is None:
+                _draft_store = DraftStore()
+    return _draft_store
+
+def new_draft_id() -> str:
+    return secrets.token_urlsafe(12)
+
+def _draft_hash(resume_data: Dict, analysis: Optional[Dict]) -> str:
+    # Edits that leave the normalized resume unchanged, such as trailing spaces, need no save
+    return canonical_hash(Resume.from_dict(resume_data).content_hash, analysis)
+
+def restore_draft() -> None:
+    """Once per session, reload the draft named in the URL, or start a new one and put its id in the URL"""
+    if 'draft_id' in st.session_state:
+        return
+    draft_id = st.query_params.get(DRAFT_QUERY_PARAM)
+    draft = None
+    if draft_id:
+        try:
+            draft = get_draft_store().load(draft_id)
+        except sqlite3.Error:
+            draft = None
+    else:
+        draft_id = new_draft_id()
+        st.query_params[DRAFT_QUERY_PARAM] = draft_id
+    st.session_state.draft_id = draft_id
+
+    if draft is None:
+        return
+    resume_data = draft['resume_data']
+    st.session_state.resume_data = resume_data
+    # The builder rebuilds its form entries from resume_data as copies (_init_entries),
+    # so the form and resume_data never share entry lists
+    for section in ('experience', 'education', 'projects'):
+        st.session_state.pop(section, None)
+    if draft['analysis'] is not None:
+        st.session_state.ai_analysis = draft['analysis']
+        # The analysis belongs to the saved resume, so edits after restore re-analyze incrementally;
+        # an offline fallback is no baseline, so the next click asks the model again
+        if not is_offline_analysis(draft['analysis']):
+            st.session_state.analyzed_resume_data = copy.deepcopy(resume_data)
+    st.session_state.draft_hash = _draft_hash(resume_data, draft['analysis'])
+
+def autosave_draft() -> None:
+    """Save the session's resume and analysis if they changed since the last save"""
+    resume_data = st.session_state.get('resume_data')
+    # Nothing worth keeping until some field has been filled in
+    if not resume_data or not any(resume_data.values()) or 'draft_id' not in st.session_state:
+        return
+    analysis = st.session_state.get('ai_analysis')
+    draft_hash = _draft_hash(resume_data, analysis)
+    if st.session_state.get('draft_hash') == draft_hash:
+        return
+    try:
+        get_draft_store().save(st.session_state.draft_id, resume_data, analysis)
+    except sqlite3.Error:
+        # The session still holds the data; the next change retries the save
+        return
+    st.session_state.draft_hash = draft_hash
+    # Keep the id in the URL even after navigating between pages
+    st.query_params[DRAFT_QUERY_PARAM] = st.session_state.draft_id
@@ -0,0 +1,151 @@
+import streamlit as st
+import hashlib
+import os
+import re
+import tempfile
+import threading
+from typing import Iterable, Iterator
+from utils.cache import LRUCache, canonical_hash
+
+STATIC_DIR = "static"
+CSS_ASSET_DIR = os.path.join(STATIC_DIR, "css")
+# Streamlit serves STATIC_DIR under app/static/ when server.enableStaticServing is on.
+# Relative, because srcdoc iframes resolve URLs against the page that embeds them
+CSS_ASSET_URL = "app/static/css"
+
+# Bump whenever the minifier's output changes to invalidate cached results
+OUTPUT_VERSION = 1
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_WHITESPACE_RE = re.compile(r'\s+')
+_CSS_PUNCTUATION_RE = re.compile(r'\s*([{};,>])\s*')
+# Only after a colon: a space before one can be a descendant combinator ("div :first-child")
+_CSS_COLON_RE = re.compile(r':\s+')
+_STYLE_RE = re.compile(r'<style\b[^>]*>(.*?)</style>', re.DOTALL | re.IGNORECASE)
+# Content whose whitespace is significant or not HTML
+_PRESERVED_RE = re.compile(r'(<(pre|textarea|script)\b.*?</\2\s*>)', re.DOTALL | re.IGNORECASE)
+_PRESERVED_OPEN_RE = re.compile(r'<(style|pre|textarea|script)\b', re.IGNORECASE)
+_HTML_COMMENT_RE = re.compile(r'<!--(?!\[if).*?-->', re.DOTALL)
+# Whitespace next to these tags is never rendered, so it can go entirely;
+# elsewhere a run of whitespace still separates words and collapses to one space
+_BLOCK_TAG = (
+    r'</?(?:!doctype|html|head|body|meta|title|link|style|div|p|h[1-6]|ul|ol|li|br|hr|table|thead|tbody|tr|td|th'
+    r'|section|header|footer|main|article|nav|aside)\b[^>]*>'
+)
+_BLOCK_TAG_RE = re.compile(rf'\s*({_BLOCK_TAG})\s*', re.IGNORECASE)
+_ENDS_WITH_BLOCK_TAG_RE = re.compile(rf'{_BLOCK_TAG}$', re.IGNORECASE)
+
+_minified_cache = LRUCache(max_entries=512, max_bytes=16 * 1024 * 1024)
+_assets = {}
+_assets_lock = threading.Lock()
+
+def minify_css(css: str) -> str:
+    """Strip comments and insignificant whitespace from a stylesheet"""
+    css = _COMMENT_RE.sub('', css)
+    css = _WHITESPACE_RE.sub(' ', css)
+    css = _CSS_PUNCTUATION_RE.sub(r'\1', css)
+    css = _CSS_COLON_RE.sub(':', css)
+    return css.replace(';}', '}').strip()
+
+def _dedupe_css(blocks: list) -> str:
+    # Templates built from fragments can repeat the same <style> block
+    return "".join(dict.fromkeys(minify_css(block) for block in blocks))
+
+def _minify_markup(html: str) -> str:
+    html = _HTML_COMMENT_RE.sub('', html)
+    html = _WHITESPACE_RE.sub(' ', html)
+    return _BLOCK_TAG_RE.sub(r'\1', html)
+
+def _minify_fragment(html: str) -> str:
+    # Style blocks are minified in place; pre, textarea and script are left untouched
+    html = _STYLE_RE.sub(lambda match: f"<style>{minify_css(match.group(1))}</style>", html)
+    parts = _PRESERVED_RE.split(html)
+    # split() interleaves text, preserved block and its tag name
+    return "".join(
+        _minify_markup(part) if index % 3 == 0 else part if index % 3 == 1 else ''
+        for index, part in enumerate(parts)
+    )
+
+def minify_html(html: str) -> str:
+    """Standalone HTML with collapsed whitespace and one minified <style> block, cached by content"""
+    cache_key = canonical_hash('__minified__', OUTPUT_VERSION, html)
+    minified = _minified_cache.get(cache_key)
+    if minified is not None:
+        return minified
+
+    css = _dedupe_css(_STYLE_RE.findall(html))
+    minified = _minify_fragment(_STYLE_RE.sub('', html))
+    if css:
+        head_end = minified.lower().find('</head>')
+        style = f"<style>{css}</style>"
+        minified = minified[:head_end] + style + minified[head_end:] if head_end >= 0 else style + minified
+    _minified_cache.put(cache_key, minified)
+    return minified
+
+def css_asset(css: str) -> str:
+    """URL of a content-versioned stylesheet holding css, written to the static folder once"""
+    digest = hashlib.sha256(css.encode('utf-8')).hexdigest()[:16]
+    url = _assets.get(digest)
+    if url is not None:
+        return url
+    with _assets_lock:
+        if digest not in _assets:
+            file_name = f"resume.{digest}.css"
+            path = os.path.join(CSS_ASSET_DIR, file_name)
+            if not os.path.exists(path):
+                os.makedirs(CSS_ASSET_DIR, exist_ok=True)
+                fd, tmp_path = tempfile.mkstemp(dir=CSS_ASSET_DIR, suffix='.tmp')
+                with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                    f.write(css)
+                os.replace(tmp_path, path)
+            _assets[digest] = f"{CSS_ASSET_URL}/{file_name}"
+        return _assets[digest]
+
+def static_serving_enabled() -> bool:
+    return bool(st.get_option('server.enableStaticServing'))
+
+def preview_html(html: str) -> str:
+    """Minified HTML for the preview iframe, linking its CSS as a cached asset when Streamlit serves static files"""
+    minified = minify_html(html)
+    if not static_serving_enabled():
+        return minified
+    match = _STYLE_RE.search(minified)
+    if match is None:
+        return minified
+    # The stylesheet is fetched once per browser; every rerun only ships the markup
+    link = f'<link rel="stylesheet" href="{css_asset(match.group(1))}">'
+    return minified[:match.start()] + link + minified[match.end():]
+
+def _safe_cut(html: str) -> int:
+    """Length of the prefix of html that minifies the same on its own as inside the whole:
+    it stops before the last tag and its leading whitespace, and outside any style, pre,
+    textarea or script block"""
+    cut = max(html.rfind('<'), 0)
+    for match in _PRESERVED_OPEN_RE.finditer(html, 0, cut):
+        close = html.lower().find(f"</{match.group(1).lower()}", match.end())
+        close_end = html.find('>', close) + 1 if close >= 0 else 0
+        if close_end == 0 or close_end > cut:
+            cut = match.start()
+            break
+    while cut > 0 and html[cut - 1].isspace():
+        cut -= 1
+    return cut
+
+def minify_stream(chunks: Iterable[str]) -> Iterator[str]:
+    """Minify HTML as it is streamed, holding back only the tail from its last tag on"""
+    pending = ''
+    after_block_tag = False
+    for chunk in chunks:
+        pending += chunk
+        cut = _safe_cut(pending)
+        if cut:
+            piece = _minify_fragment(pending[:cut])
+            pending = pending[cut:]
+            # Whitespace after a block tag is dropped even when the tag ended the previous piece
+            if after_block_tag:
+                piece = piece.lstrip()
+            after_block_tag = bool(_ENDS_WITH_BLOCK_TAG_RE.search(piece))
+            yield piece
+    if pending:
+        piece = _minify_fragment(pending)
+        yield piece.lstrip() if after_block_tag else piece
@@ -0,0 +1,48 @@
+import streamlit as st
+
+def show_job_match():
+    # numpy and scipy are only needed here, so they load on the first visit to this page
+    from utils.job_matcher import build_job_index, get_job_matcher, read_job_postings
+
+    st.title("💼 Job Match")
+    st.markdown("---")
+
+    if 'resume_data' not in st.session_state or not st.session_state.resume_data:
+        st.warning("Please build your resume first!")
+        return
+
+    with st.expander("📥 Job postings", expanded=get_job_matcher() is None):
+        uploaded = st.file_uploader(
+            "Upload postings (.json, .jsonl or .csv with title, company and description)",
+            type=['json', 'jsonl', 'csv']
+        )
+        if uploaded is not None and st.button("Build job index", type="primary"):
+            try:
+                postings = read_job_postings(uploaded, uploaded.name)
+            except ValueError as e:
+                st.error(f"Could not read postings: {str(e)}")
+                return
+            with st.spinner(f"Indexing {len(postings)} postings..."):
+                build_job_index(postings)
+            st.success(f"Indexed {len(postings)} postings")
+
+    matcher = get_job_matcher()
+    if matcher is None:
+        st.info("Upload job postings to rank them against your resume")
+        return
+
+    top_k = st.slider("Matches to show", 5, 50, 10)
+    matches = matcher.rank_resume(st.session_state.resume_data, top_k)
+    st.caption(f"Ranked {len(matcher)} postings against your resume")
+
+    for rank, match in enumerate(matches, 1):
+        title = f"{rank}. {match['title']}" + (f" at {match['company']}" if match['company'] else '')
+        col1, col2 = st.columns([4, 1])
+        with col1:
+            st.subheader(title)
+            if match['matched_terms']:
+                st.caption(f"Matching on: {', '.join(match['matched_terms'])}")
+            if match['url']:
+                st.markdown(f"[View posting]({match['url']})")
+        with col2:
+            st.metric("Match", f"{match['score'] * 100:.0f}%")
@@ -0,0 +1,239 @@
+import csv
+import io
+import json
+import math
+import os
+import re
+import shutil
+import tempfile
+from collections import Counter
+from functools import lru_cache
+from typing import Dict, IO, Iterable, List, Optional, Tuple
+
+import numpy as np
+from scipy import sparse
+
+from utils.keyword_index import get_keyword_index, resume_text
+
+JOB_INDEX_DIR = os.getenv('NEURACV_JOB_INDEX_DIR', os.path.join("data", "job_index"))
+# Bump whenever tokenization or weighting changes so stale indexes are rebuilt
+JOB_INDEX_VERSION = 1
+
+TOKEN_RE = re.compile(r"[a-z][a-z0-9+#]*(?:[./-][a-z0-9+#]+)*")
+STOP_WORDS = frozenset((
+    'a', 'about', 'across', 'all', 'also', 'an', 'and', 'any', 'are', 'as', 'at', 'be', 'been', 'but',
+    'by', 'can', 'do', 'for', 'from', 'has', 'have', 'if', 'in', 'into', 'is', 'it', 'its', 'more',
+    'must', 'need', 'new', 'not', 'of', 'on', 'or', 'our', 'over', 'per', 'plus', 'role', 'such',
+    'that', 'the', 'their', 'they', 'this', 'to', 'us', 'using', 'we', 'will', 'with', 'within',
+    'work', 'you', 'your', 'years', 'year', 'experience', 'team', 'strong', 'ability', 'looking'
+))
+# Canonical skills are added as their own terms so synonyms ('k8s', 'kubernetes') meet in one column
+SKILL_PREFIX = 'skill:'
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased word terms without stop words, plus one term per canonical skill mentioned"""
+    terms = [term for term in TOKEN_RE.findall(text.lower()) if term not in STOP_WORDS and len(term) > 1]
+    terms.extend(SKILL_PREFIX + skill.lower() for skill in get_keyword_index().scan(text))
+    return terms
+
+def _weights(counts: Counter) -> Dict[str, float]:
+    # Sublinear term frequency, so one term repeated ten times does not dominate
+    return {term: 1.0 + math.log(count) for term, count in counts.items()}
+
+class JobMatcher:
+    """TF-IDF matrix of job postings; ranks every posting against a resume with one sparse mat-vec"""
+
+    def __init__(self, matrix: sparse.csr_matrix, idf: np.ndarray, terms: List[str], jobs: List[Dict]):
+        self.matrix = matrix
+        self.idf = idf
+        self.terms = terms
+        self.vocabulary = {term: column for column, term in enumerate(terms)}
+        self.jobs = jobs
+
+    def __len__(self) -> int:
+        return self.matrix.shape[0]
+
+    @classmethod
+    def build(cls, postings: Iterable[Dict], min_df: int = 1, max_df: float = 0.9) -> 'JobMatcher':
+        """Index postings with 'title', 'description' and optionally 'company', 'id' and 'url'"""
+        jobs, documents = [], []
+        for position, posting in enumerate(postings):
+            # Missing fields may be null in JSON; they must not be indexed or shown as "None"
+            text = f"{posting.get('title') or ''}\n{posting.get('description') or ''}"
+            documents.append(Counter(tokenize(text)))
+            jobs.append({
+                'id': str(posting.get('id') or position),
+                'title': posting.get('title') or '',
+                'company': posting.get('company') or '',
+                'url': posting.get('url') or ''
+            })
+
+        document_frequency = Counter()
+        for counts in documents:
+            document_frequency.update(counts.keys())
+        count = len(documents)
+        # Terms in nearly every posting ('responsibilities', 'requirements') carry no signal
+        ceiling = max(1, int(max_df * count)) if count > 10 else count
+        terms = sorted(term for term, df in document_frequency.items() if min_df <= df <= ceiling)
+        vocabulary = {term: column for column, term in enumerate(terms)}
+        idf = np.array(
+            [math.log((1 + count) / (1 + document_frequency[term])) + 1.0 for term in terms],
+            dtype=np.float32
+        )
+
+        indptr = [0]
+        indices, data = [], []
+        for counts in documents:
+            row = sorted(
+                (vocabulary[term], weight) for term, weight in _weights(counts).items() if term in vocabulary
+            )
+            values = np.array([weight * idf[column] for column, weight in row], dtype=np.float32)
+            norm = float(np.linalg.norm(values)) if len(values) else 0.0
+            indices.extend(column for column, _ in row)
+            data.extend((values / norm).tolist() if norm else values.tolist())
+            indptr.append(len(indices))
+
+        # scipy wants indices and indptr in one dtype; keeping both int32 lets load() map them without a copy
+        index_dtype = np.int32 if len(indices) < 2 ** 31 else np.int64
+        matrix = sparse.csr_matrix(
+            (np.array(data, dtype=np.float32), np.array(indices, dtype=index_dtype),
+             np.array(indptr, dtype=index_dtype)),
+            shape=(count, len(terms))
+        )
+        return cls(matrix, idf, terms, jobs)
+
+    def save(self, directory: str = JOB_INDEX_DIR) -> None:
+        """Write the index as .npy arrays that load() memory-maps, replacing any previous index atomically"""
+        parent = os.path.dirname(os.path.abspath(directory))
+        os.makedirs(parent, exist_ok=True)
+        staging = tempfile.mkdtemp(dir=parent, prefix='.job_index.')
+        np.save(os.path.join(staging, 'data.npy'), self.matrix.data)
+        np.save(os.path.join(staging, 'indices.npy'), self.matrix.indices)
+        np.save(os.path.join(staging, 'indptr.npy'), self.matrix.indptr)
+        np.save(os.path.join(staging, 'idf.npy'), self.idf)
+        with open(os.path.join(staging, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump({
+                'version': JOB_INDEX_VERSION,
+                'shape': list(self.matrix.shape),
+                'terms': self.terms,
+                'jobs': self.jobs
+            }, f, ensure_ascii=False, separators=(',', ':'))
+
+        if os.path.isdir(directory):
+            retired = f"{staging}.old"
+            os.replace(directory, retired)
+            os.replace(staging, directory)
+            shutil.rmtree(retired, ignore_errors=True)
+        else:
+            os.replace(staging, directory)
+
+    @classmethod
+    def load(cls, directory: str = JOB_INDEX_DIR) -> Optional['JobMatcher']:
+        """Memory-map a saved index; pages are read on demand, so loading costs only the metadata parse"""
+        try:
+            with open(os.path.join(directory, 'meta.json'), encoding='utf-8') as f:
+                meta = json.load(f)
+            if meta.get('version') != JOB_INDEX_VERSION:
+                return None
+            # save() may swap the directory between reads; a missing array is treated like no index
+            arrays = {
+                name: np.load(os.path.join(directory, f"{name}.npy"), mmap_mode='r')
+                for name in ('data', 'indices', 'indptr', 'idf')
+            }
+        except (OSError, ValueError):
+            return None
+        matrix = sparse.csr_matrix(
+            (arrays['data'], arrays['indices'], arrays['indptr']),
+            shape=tuple(meta['shape']), copy=False
+        )
+        return cls(matrix, arrays['idf'], meta['terms'], meta['jobs'])
+
+    def query_vector(self, text: str) -> np.ndarray:
+        """Dense, L2-normalized TF-IDF vector of text over the index vocabulary"""
+        vector = np.zeros(len(self.terms), dtype=np.float32)
+        for term, weight in _weights(Counter(tokenize(text))).items():
+            column = self.vocabulary.get(term)
+            if column is not None:
+                vector[column] = weight * self.idf[column]
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def rank(self, text: str, top_k: int = 10) -> List[Dict]:
+        """The top_k postings by cosine similarity to text, best first"""
+        if not len(self):
+            return []
+        query = self.query_vector(text)
+        scores = self.matrix @ query
+        top_k = min(top_k, len(scores))
+        # argpartition finds the top k in linear time; only those k are sorted
+        top = np.argpartition(-scores, top_k - 1)[:top_k]
+        top = top[np.argsort(-scores[top], kind='stable')]
+        return [
+            dict(self.jobs[row], score=float(scores[row]), matched_terms=self._matched_terms(row, query))
+            for row in top
+        ]
+
+    def rank_resume(self, resume_data: Dict, top_k: int = 10) -> List[Dict]:
+        return self.rank(resume_text(resume_data), top_k)
+
+    def _matched_terms(self, row: int, query: np.ndarray, limit: int = 5) -> List[str]:
+        """Terms contributing most to one posting's score"""
+        start, end = self.matrix.indptr[row], self.matrix.indptr[row + 1]
+        columns = np.asarray(self.matrix.indices[start:end])
+        contributions = np.asarray(self.matrix.data[start:end]) * query[columns]
+        names = []
+        for i in np.argsort(-contributions):
+            name = self.terms[columns[i]].replace(SKILL_PREFIX, '')
+            if contributions[i] <= 0 or len(names) == limit:
+                break
+            # A skill and its plain word form ('skill:python', 'python') are reported once
+            if name not in names:
+                names.append(name)
+        return names
+
+def read_job_postings(file: IO, name: str = '') -> List[Dict]:
+    """Postings from an uploaded .json (list), .jsonl or .csv file with title/description columns"""
+    name = (name or getattr(file, 'name', '')).lower()
+    raw = file.read()
+    text = raw.decode('utf-8-sig') if isinstance(raw, bytes) else raw
+    if name.endswith('.csv'):
+        # Cells missing from short rows read as None; cells beyond the header land under a None key
+        postings = [
+            {key: value or '' for key, value in row.items() if key is not None}
+            for row in csv.DictReader(io.StringIO(text))
+        ]
+    elif name.endswith('.jsonl'):
+        postings = [json.loads(line) for line in text.splitlines() if line.strip()]
+    else:
+        postings = json.loads(text)
+        if isinstance(postings, dict):
+            postings = postings.get('jobs', [])
+    if not isinstance(postings, list):
+        raise ValueError("expected a list of job postings")
+    for number, posting in enumerate(postings, 1):
+        if not isinstance(posting, dict):
+            raise ValueError(f"posting {number} is {type(posting).__name__}, not an object")
+        if not (posting.get('title') or posting.get('description')):
+            raise ValueError(f"posting {number} has neither a title nor a description")
+    return postings
+
+def _index_stamp(directory: str) -> Tuple:
+    try:
+        stat = os.stat(os.path.join(directory, 'meta.json'))
+    except OSError:
+        return ()
+    return (stat.st_mtime_ns, stat.st_size)
+
+@lru_cache(maxsize=4)
+def _load_cached(directory: str, stamp: Tuple) -> Optional[JobMatcher]:
+    return JobMatcher.load(directory)
+
+def get_job_matcher(directory: str = JOB_INDEX_DIR) -> Optional[JobMatcher]:
+    """The saved job index, loaded once per process and reloaded after it is rebuilt"""
+    return _load_cached(directory, _index_stamp(directory))
+
+def build_job_index(postings: Iterable[Dict], directory: str = JOB_INDEX_DIR) -> JobMatcher:
+    """Index postings and persist them for get_job_matcher()"""
+    matcher = JobMatcher.build(postings)
+    matcher.save(directory)
+    return matcher
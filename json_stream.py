@@ -0,0 +1,90 @@
+import json
+from typing import Any, List, Tuple
+
+class IncrementalJSONParser:
+    """Parse a JSON document as it arrives, emitting each scalar value once it is complete.
+
+    feed() returns (path, value) pairs where path is the tuple of object keys and
+    array indices leading to the value, e.g. ('suggestions', 'overall_feedback', 0).
+    Text before the first '{' or '[' (such as a markdown fence) and after the root
+    value closes is ignored.
+    """
+
+    def __init__(self):
+        self._stack = []
+        self._expect_key = False
+        self._key = False
+        self._string = None
+        self._escape = False
+        self._literal = None
+        self._started = False
+        self.done = False
+
+    def _path(self) -> Tuple:
+        return tuple(frame[1] for frame in self._stack)
+
+    def _finish_literal(self, events: List) -> None:
+        text = ''.join(self._literal)
+        self._literal = None
+        try:
+            events.append((self._path(), json.loads(text)))
+        except ValueError:
+            pass
+
+    def feed(self, text: str) -> List[Tuple[Tuple, Any]]:
+        events = []
+        for char in text:
+            if self.done:
+                break
+
+            if self._string is not None:
+                if self._escape:
+                    self._escape = False
+                elif char == '\\':
+                    self._escape = True
+                elif char == '"':
+                    value = json.loads('"' + ''.join(self._string) + '"')
+                    self._string = None
+                    if self._key:
+                        self._stack[-1][1] = value
+                        self._key = False
+                    else:
+                        events.append((self._path(), value))
+                    continue
+                self._string.append(char)
+                continue
+
+            if self._literal is not None:
+                if char.isalnum() or char in '+-.':
+                    self._literal.append(char)
+                    continue
+                self._finish_literal(events)
+
+            if not self._started:
+                if char not in '{[':
+                    continue
+                self._started = True
+
+            if char in ' \t\r\n':
+                continue
+            if char == '{':
+                self._stack.append(['object', None])
+                self._expect_key = True
+            elif char == '[':
+                self._stack.append(['array', 0])
+            elif char in '}]':
+                self._stack.pop()
+                self.done = not self._stack
+            elif char == ':':
+                self._expect_key = False
+            elif char == ',':
+                if self._stack and self._stack[-1][0] == 'array':
+                    self._stack[-1][1] += 1
+                else:
+                    self._expect_key = True
+            elif char == '"':
+                self._string = []
+                self._key = bool(self._stack) and self._stack[-1][0] == 'object' and self._expect_key
+            else:
+                self._literal = [char]
+        return events
@@ -0,0 +1,186 @@
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+
+# Canonical skill -> the spellings that normalize to it (matched case-insensitively)
+SKILLS_TAXONOMY = {
+    # Languages
+    'Python': ('python', 'python3'),
+    'Java': ('java',),
+    'JavaScript': ('javascript', 'js', 'ecmascript', 'es6'),
+    'TypeScript': ('typescript',),
+    'C++': ('c++', 'cpp'),
+    'C#': ('c#', 'csharp', 'c sharp'),
+    'Go': ('golang', 'go lang'),
+    'Rust': ('rust',),
+    'Ruby': ('ruby',),
+    'PHP': ('php',),
+    'Kotlin': ('kotlin',),
+    'Swift': ('swift',),
+    'Scala': ('scala',),
+    'R': ('r programming', 'rstudio'),
+    'SQL': ('sql', 't-sql', 'pl/sql'),
+    'Bash': ('bash', 'shell scripting', 'shell script'),
+    # Web and frameworks
+    'HTML': ('html', 'html5'),
+    'CSS': ('css', 'css3', 'sass', 'scss'),
+    'React': ('react', 'reactjs', 'react.js'),
+    'Angular': ('angular', 'angularjs'),
+    'Vue.js': ('vue', 'vuejs', 'vue.js'),
+    'Node.js': ('nodejs', 'node.js'),
+    'Django': ('django',),
+    'Flask': ('flask',),
+    'FastAPI': ('fastapi',),
+    'Spring': ('spring', 'spring boot', 'springboot'),
+    'REST APIs': ('rest', 'restful', 'rest api', 'rest apis'),
+    'GraphQL': ('graphql',),
+    'Microservices': ('microservices', 'microservice', 'service-oriented architecture', 'soa'),
+    # Data and ML
+    'PostgreSQL': ('postgresql', 'postgres', 'psql'),
+    'MySQL': ('mysql',),
+    'MongoDB': ('mongodb', 'mongo'),
+    'Redis': ('redis',),
+    'Elasticsearch': ('elasticsearch', 'elastic search', 'opensearch'),
+    'Kafka': ('kafka', 'apache kafka'),
+    'Spark': ('spark', 'pyspark', 'apache spark'),
+    'Airflow': ('airflow', 'apache airflow'),
+    'Pandas': ('pandas',),
+    'NumPy': ('numpy',),
+    'Machine Learning': ('machine learning', 'ml'),
+    'Deep Learning': ('deep learning', 'neural networks', 'neural network'),
+    'NLP': ('nlp', 'natural language processing'),
+    'Computer Vision': ('computer vision', 'opencv'),
+    'TensorFlow': ('tensorflow', 'tf2'),
+    'PyTorch': ('pytorch', 'torch'),
+    'scikit-learn': ('scikit-learn', 'sklearn', 'scikit learn'),
+    'Data Analysis': ('data analysis', 'data analytics', 'analytics'),
+    'Data Visualization': ('data visualization', 'tableau', 'power bi', 'powerbi'),
+    'ETL': ('etl', 'elt', 'data pipelines', 'data pipeline'),
+    # Cloud and operations
+    'AWS': ('aws', 'amazon web services', 'ec2', 's3', 'aws lambda'),
+    'Azure': ('azure', 'microsoft azure'),
+    'GCP': ('gcp', 'google cloud', 'google cloud platform'),
+    'Docker': ('docker', 'containers', 'containerization'),
+    'Kubernetes': ('kubernetes', 'k8s', 'eks', 'gke', 'aks'),
+    'Terraform': ('terraform', 'infrastructure as code', 'iac'),
+    'CI/CD': ('ci/cd', 'ci cd', 'continuous integration', 'continuous delivery', 'continuous deployment',
+              'jenkins', 'github actions', 'gitlab ci'),
+    'Linux': ('linux', 'unix'),
+    'Git': ('git', 'github', 'gitlab', 'version control'),
+    'Monitoring': ('monitoring', 'observability', 'prometheus', 'grafana', 'datadog'),
+    'Testing': ('testing', 'unit testing', 'unit tests', 'test automation', 'pytest', 'junit', 'tdd'),
+    'Security': ('security', 'cybersecurity', 'owasp', 'penetration testing'),
+    # Practices and soft skills
+    'Agile': ('agile', 'scrum', 'kanban', 'sprint planning'),
+    'Leadership': ('leadership', 'team lead', 'tech lead', 'led a team', 'led teams'),
+    'Project Management': ('project management', 'program management', 'pmp'),
+    'Product Management': ('product management', 'product roadmap', 'roadmapping'),
+    'Stakeholder Management': ('stakeholder management', 'stakeholders', 'stakeholder'),
+    'Communication': ('communication', 'communication skills', 'presentations', 'public speaking'),
+    'Collaboration': ('collaboration', 'cross-functional', 'cross functional', 'teamwork'),
+    'Mentoring': ('mentoring', 'mentored', 'mentorship', 'coaching'),
+    'Problem Solving': ('problem solving', 'problem-solving', 'troubleshooting'),
+    'Strategy': ('strategy', 'strategic planning', 'strategic'),
+    'Budgeting': ('budgeting', 'budget', 'budgets', 'p&l'),
+    'System Design': ('system design', 'distributed systems', 'scalability', 'scalable', 'high availability'),
+    'Performance Optimization': ('performance optimization', 'optimization', 'performance tuning', 'profiling'),
+    'Automation': ('automation', 'automated', 'scripting'),
+    'UX Design': ('ux design', 'ux', 'ui/ux', 'user experience', 'figma', 'wireframing'),
+}
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == '_'
+
+class KeywordIndex:
+    """Aho-Corasick automaton over every synonym in a taxonomy; one pass over the text finds them all"""
+
+    def __init__(self, taxonomy: Dict[str, Iterable[str]]):
+        # Node i is (transitions, failure link, canonical skills of patterns ending here)
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[List[Tuple[str, int]]] = [[]]
+        self._canonical: Dict[str, str] = {}
+
+        for skill, synonyms in taxonomy.items():
+            self._canonical[skill.lower()] = skill
+            # Only listed synonyms are searched for, so ambiguous names like 'Go' or 'R' need an explicit spelling
+            for pattern in {synonym.lower() for synonym in synonyms}:
+                self._canonical[pattern] = skill
+                self._add(pattern, skill)
+        self._link()
+
+    def _add(self, pattern: str, skill: str) -> None:
+        node = 0
+        for char in pattern:
+            next_node = self._goto[node].get(char)
+            if next_node is None:
+                next_node = len(self._goto)
+                self._goto[node][char] = next_node
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append([])
+            node = next_node
+        self._output[node].append((skill, len(pattern)))
+
+    def _link(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for char, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._output[child] = self._output[child] + self._output[self._fail[child]]
+
+    def canonical(self, term: str) -> str:
+        """Canonical skill name for a synonym, or the term itself when it is not in the taxonomy"""
+        return self._canonical.get(term.strip().lower(), term.strip())
+
+    def scan(self, text: str) -> Set[str]:
+        """Canonical skills mentioned anywhere in text, matching whole words only"""
+        text = text.lower()
+        found = set()
+        node = 0
+        goto, fail, output = self._goto, self._fail, self._output
+        for end, char in enumerate(text):
+            while node and char not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(char, 0)
+            for skill, length in output[node]:
+                start = end - length + 1
+                if (start == 0 or not _is_word_char(text[start - 1])) and \
+                        (end + 1 == len(text) or not _is_word_char(text[end + 1])):
+                    found.add(skill)
+        return found
+
+    def keyword_gap(self, resume_text: str, job_text: str) -> Dict[str, List[str]]:
+        """Skills the job asks for that the resume has ('matched') and lacks ('missing')"""
+        resume_skills = self.scan(resume_text)
+        job_skills = self.scan(job_text)
+        return {
+            'matched': sorted(job_skills & resume_skills),
+            'missing': sorted(job_skills - resume_skills)
+        }
+
+@lru_cache(maxsize=None)
+def get_keyword_index() -> KeywordIndex:
+    """Keyword index over SKILLS_TAXONOMY, built once per process"""
+    return KeywordIndex(SKILLS_TAXONOMY)
+
+def resume_text(resume_data: Dict) -> str:
+    """All searchable text in a resume, one field per line"""
+    parts = []
+    personal_info = resume_data.get('personal_info', {})
+    parts.extend(str(value) for key, value in personal_info.items() if key in ('title', 'summary') and value)
+    for key in ('experience', 'projects', 'education'):
+        for entry in resume_data.get(key, []):
+            parts.extend(str(value) for value in entry.values() if value)
+    for key in ('technical_skills', 'soft_skills', 'certifications'):
+        parts.extend(str(value) for value in resume_data.get(key, []))
+    return '\n'.join(parts)
+
+def keyword_gap(resume_data: Dict, job_description: str) -> Dict[str, List[str]]:
+    """Matched and missing taxonomy skills of a resume against a job description"""
+    return get_keyword_index().keyword_gap(resume_text(resume_data), job_description)
@@ -0,0 +1,148 @@
+import importlib.util
+import logging
+import multiprocessing
+import os
+import threading
+from typing import Optional
+from utils.cache import DiskCache, LRUCache, canonical_hash
+from utils.template_engine import render_template
+
+logger = logging.getLogger(__name__)
+
+PDF_CACHE_DIR = os.getenv('NEURACV_PDF_CACHE_DIR', os.path.join("data", "pdf_cache"))
+PDF_CACHE_MAX_BYTES = 256 * 1024 * 1024
+# Renderer processes kept warm; each holds its own font configuration and parsed stylesheet
+PDF_WORKERS = int(os.getenv('NEURACV_PDF_WORKERS', str(min(4, os.cpu_count() or 1))))
+PDF_RENDER_TIMEOUT = float(os.getenv('NEURACV_PDF_RENDER_TIMEOUT', '60'))
+# Bump when the print stylesheet or renderer settings change to invalidate cached PDFs
+PDF_RENDERER_VERSION = 1
+
+# Page setup applied on top of each template's own CSS
+PDF_BASE_CSS = """
+@page { size: A4; margin: 12mm; }
+body { -weasy-hyphens: auto; }
+"""
+_WARMUP_HTML = "<html><body><h1>Resume</h1><p>Warm-up render</p></body></html>"
+
+_pdf_memory = LRUCache(max_entries=64, max_bytes=32 * 1024 * 1024)
+_pdf_disk = None
+_pool = None
+_pool_lock = threading.Lock()
+_warmup_started = False
+
+# Per-process renderer state, filled in by _init_worker
+_renderer = {}
+
+def pdf_available() -> bool:
+    """Whether the PDF renderer is installed, checked without importing it"""
+    return importlib.util.find_spec('weasyprint') is not None
+
+def _init_worker() -> None:
+    """Pay renderer startup once per worker: import, font discovery, CSS parsing and a first layout"""
+    from weasyprint import CSS, HTML
+    from weasyprint.text.fonts import FontConfiguration
+
+    font_config = FontConfiguration()
+    _renderer['html'] = HTML
+    _renderer['font_config'] = font_config
+    _renderer['stylesheets'] = [CSS(string=PDF_BASE_CSS, font_config=font_config)]
+    _render(_WARMUP_HTML)
+
+def _render(html: str) -> bytes:
+    return _renderer['html'](string=html).write_pdf(
+        stylesheets=_renderer['stylesheets'], font_config=_renderer['font_config']
+    )
+
+def _noop() -> None:
+    return None
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                # The pool is only needed once someone exports, so it stays out of the import path
+                from concurrent.futures import ProcessPoolExecutor
+                # Forking a threaded Streamlit server is unsafe; spawned workers start clean
+                _pool = ProcessPoolExecutor(
+                    max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context('spawn'),
+                    initializer=_init_worker
+                )
+    return _pool
+
+def warm_pdf_pool() -> None:
+    """Start every renderer process now instead of on the first exports"""
+    pool = _get_pool()
+    for future in [pool.submit(_noop) for _ in range(PDF_WORKERS)]:
+        future.result(timeout=PDF_RENDER_TIMEOUT)
+
+def _warm_quietly() -> None:
+    try:
+        warm_pdf_pool()
+    except Exception as e:
+        # html_to_pdf reports the same failure to whoever exports next
+        logger.warning("PDF renderer warm-up failed: %s", e)
+        shutdown_pdf_pool()
+
+def warm_pdf_pool_in_background() -> None:
+    """Once per process, start the renderer processes on a background thread so the first export is warm"""
+    global _warmup_started
+    if _warmup_started or not pdf_available():
+        return
+    with _pool_lock:
+        if _warmup_started:
+            return
+        _warmup_started = True
+    threading.Thread(target=_warm_quietly, name='pdf-warmup', daemon=True).start()
+
+def shutdown_pdf_pool() -> None:
+    global _pool
+    with _pool_lock:
+        if _pool is not None:
+            _pool.shutdown(wait=True, cancel_futures=True)
+            _pool = None
+
+def _disk_cache() -> DiskCache:
+    global _pdf_disk
+    if _pdf_disk is None:
+        _pdf_disk = DiskCache(PDF_CACHE_DIR, max_bytes=PDF_CACHE_MAX_BYTES, suffix='.pdf')
+    return _pdf_disk
+
+def pdf_cache_key(html: str) -> str:
+    return canonical_hash(PDF_RENDERER_VERSION, html)
+
+def cached_pdf(html: str) -> Optional[bytes]:
+    """The PDF for html if it was exported before, without rendering"""
+    key = pdf_cache_key(html)
+    pdf = _pdf_memory.get(key)
+    if pdf is None:
+        pdf = _disk_cache().get(key)
+        if pdf is not None:
+            _pdf_memory.put(key, pdf)
+    return pdf
+
+def html_to_pdf(html: str) -> bytes:
+    """PDF bytes for rendered resume HTML, from cache or a warm renderer process"""
+    pdf = cached_pdf(html)
+    if pdf is not None:
+        return pdf
+
+    from concurrent.futures.process import BrokenProcessPool
+
+    try:
+        pdf = _get_pool().submit(_render, html).result(timeout=PDF_RENDER_TIMEOUT)
+    except BrokenProcessPool:
+        # A crashed renderer poisons the whole pool; start a fresh one for the next export
+        shutdown_pdf_pool()
+        raise
+    key = pdf_cache_key(html)
+    _pdf_memory.put(key, pdf)
+    _disk_cache().put(key, pdf)
+    return pdf
+
+def render_pdf(template_name: str, resume_data: dict, improved: bool = False) -> bytes:
+    return html_to_pdf(render_template(template_name, resume_data, improved))
+
+def pdf_cache_stats() -> dict:
+    """Hit/miss counters of the in-memory PDF cache"""
+    return _pdf_memory.stats()
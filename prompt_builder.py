@@ -0,0 +1,174 @@
+import copy
+import json
+import logging
+import math
+import os
+import threading
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROMPT_TOKEN_BUDGET = int(os.getenv('OPENAI_PROMPT_TOKEN_BUDGET', '1500'))
+COMPLETION_TOKEN_LIMIT = 1500
+SECTION_COMPLETION_TOKEN_LIMIT = 800
+# Feedback fields on top of the echoed improved_content
+FEEDBACK_TOKENS = 300
+DESCRIPTION_LIMIT = 400
+
+# Lowest priority first; sections are trimmed in this order until the prompt fits
+TRUNCATION_ORDER = (
+    'languages', 'certifications', 'soft_skills', 'projects',
+    'education', 'technical_skills', 'experience', 'personal_info'
+)
+
+SYSTEM_PROMPT = "You are an expert resume coach and ATS specialist. Reply with JSON only."
+
+ANALYSIS_INSTRUCTIONS = (
+    'Analyze this resume for ATS compatibility and reply in this JSON format: '
+    '{"ats_score":0-100,"suggestions":{"overall_feedback":[str],'
+    '"section_feedback":{"personal_info":[str],"experience":[str],"skills":[str]},'
+    '"missing_keywords":[str]},"improved_content":<the resume in the same schema with improved wording>}\n'
+    'Resume: '
+)
+
+SECTION_INSTRUCTIONS = (
+    'The candidate edited the resume sections {sections}. The rest is unchanged and previously '
+    'scored {score}/100. Give feedback on the edited sections only, in this JSON format: '
+    '{{"ats_score":0-100 adjusted for the edits,"overall_feedback":[str],'
+    '"section_feedback":{{{section_keys}}},"missing_keywords":[str],'
+    '"improved_content":<the edited data in the same schema with improved wording>}}\n'
+    'Edited sections: '
+)
+
+_encoder = None
+_encoder_loaded = False
+
+def estimate_tokens(text: str) -> int:
+    """Token count from tiktoken when installed, else the ~4 characters per token rule of thumb"""
+    global _encoder, _encoder_loaded
+    if not _encoder_loaded:
+        try:
+            import tiktoken
+            _encoder = tiktoken.get_encoding('cl100k_base')
+        except Exception:
+            _encoder = None
+        _encoder_loaded = True
+    if _encoder is not None:
+        return len(_encoder.encode(text))
+    return math.ceil(len(text) / 4)
+
+def compact(value: Any) -> Any:
+    """Drop empty strings, lists and dicts and strip whitespace, recursively"""
+    if isinstance(value, dict):
+        items = ((key, compact(item)) for key, item in value.items())
+        return {key: item for key, item in items if item not in (None, '', [], {})}
+    if isinstance(value, list):
+        items = (compact(item) for item in value)
+        return [item for item in items if item not in (None, '', [], {})]
+    if isinstance(value, str):
+        return ' '.join(value.split())
+    return value
+
+def minified_json(value: Any) -> str:
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+def fit_to_budget(data: Dict, budget: int, overhead: int = 0) -> Tuple[Dict, List[str]]:
+    """Trim the lowest-priority sections until data fits in `budget` tokens; returns (data, trimmed sections)"""
+    data = copy.deepcopy(data)
+    trimmed = []
+
+    def fits() -> bool:
+        return overhead + estimate_tokens(minified_json(data)) <= budget
+
+    for key in TRUNCATION_ORDER:
+        if fits():
+            break
+        value = data.get(key)
+        if not value:
+            continue
+        trimmed.append(key)
+        if isinstance(value, dict):
+            if value.get('summary'):
+                value['summary'] = value['summary'][:DESCRIPTION_LIMIT]
+            continue
+        # Shorten long descriptions before dropping entries outright
+        for item in value:
+            if isinstance(item, dict) and len(item.get('description', '')) > DESCRIPTION_LIMIT:
+                item['description'] = item['description'][:DESCRIPTION_LIMIT]
+        while value and not fits():
+            value.pop()
+        if not value:
+            del data[key]
+
+    return data, trimmed
+
+def build_analysis_prompt(resume_data: Dict, budget: int = PROMPT_TOKEN_BUDGET) -> Tuple[List[Dict], Dict]:
+    """Messages for a full analysis plus token estimates"""
+    overhead = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(ANALYSIS_INSTRUCTIONS)
+    data, trimmed = fit_to_budget(compact(resume_data), budget, overhead)
+    payload = minified_json(data)
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": ANALYSIS_INSTRUCTIONS + payload}
+    ]
+    # The reply echoes the resume as improved_content, plus the feedback fields
+    completion = min(COMPLETION_TOKEN_LIMIT, estimate_tokens(payload) + FEEDBACK_TOKENS)
+    return messages, _estimate(messages, completion, COMPLETION_TOKEN_LIMIT, trimmed)
+
+def build_section_prompt(updated: Dict, sections: List[str], previous_score: Optional[int],
+                         budget: int = PROMPT_TOKEN_BUDGET) -> Tuple[List[Dict], Dict]:
+    """Messages for re-analyzing only the edited sections plus token estimates"""
+    instructions = SECTION_INSTRUCTIONS.format(
+        sections=', '.join(sections),
+        score=previous_score if previous_score is not None else 'unknown',
+        section_keys=','.join(f'"{section}":[str]' for section in sections)
+    )
+    overhead = estimate_tokens(SYSTEM_PROMPT) + estimate_tokens(instructions)
+    data, trimmed = fit_to_budget(compact(updated), budget, overhead)
+    payload = minified_json(data)
+    messages = [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": instructions + payload}
+    ]
+    completion = min(SECTION_COMPLETION_TOKEN_LIMIT, estimate_tokens(payload) + FEEDBACK_TOKENS)
+    return messages, _estimate(messages, completion, SECTION_COMPLETION_TOKEN_LIMIT, trimmed)
+
+def _estimate(messages: List[Dict], completion: int, max_tokens: int, trimmed: List[str]) -> Dict:
+    return {
+        'prompt_tokens': sum(estimate_tokens(message['content']) for message in messages),
+        'completion_tokens': completion,
+        'max_tokens': max_tokens,
+        'trimmed_sections': trimmed
+    }
+
+_usage_lock = threading.Lock()
+_usage = {
+    'calls': 0,
+    'estimated_prompt_tokens': 0,
+    'estimated_completion_tokens': 0,
+    'prompt_tokens': 0,
+    'completion_tokens': 0
+}
+
+def record_token_usage(estimate: Dict, usage: Optional[Any] = None) -> None:
+    """Log one model call's estimated and, when the API reports it, actual token usage"""
+    prompt_tokens = getattr(usage, 'prompt_tokens', None)
+    completion_tokens = getattr(usage, 'completion_tokens', None)
+    logger.info(
+        "OpenAI call: ~%d prompt / ~%d completion tokens estimated (actual %s / %s)%s",
+        estimate['prompt_tokens'], estimate['completion_tokens'],
+        prompt_tokens if prompt_tokens is not None else '?',
+        completion_tokens if completion_tokens is not None else '?',
+        f", trimmed {', '.join(estimate['trimmed_sections'])}" if estimate['trimmed_sections'] else ''
+    )
+    with _usage_lock:
+        _usage['calls'] += 1
+        _usage['estimated_prompt_tokens'] += estimate['prompt_tokens']
+        _usage['estimated_completion_tokens'] += estimate['completion_tokens']
+        _usage['prompt_tokens'] += prompt_tokens or 0
+        _usage['completion_tokens'] += completion_tokens or 0
+
+def token_usage_stats() -> Dict:
+    """Totals of estimated and reported token usage in this process"""
+    with _usage_lock:
+        return dict(_usage)
@@ -0,0 +1,381 @@
+import streamlit as st
+import copy
+import logging
+import os
+import time
+from functools import wraps
+from utils.ai_suggestions import get_ai_suggestions, is_offline_analysis, offline_analysis
+from utils.draft_store import autosave_draft
+from utils.resume_model import Resume
+
+logger = logging.getLogger(__name__)
+
+# Show how long each builder section took to render, under the section
+SHOW_RERUN_TIMING = os.getenv('NEURACV_SHOW_RERUN_TIMING', '') == '1'
+
+# Entry section -> fields an entry needs before it is included in resume_data
+ENTRY_REQUIRED = {
+    'experience': ('title', 'company'),
+    'education': ('degree', 'institution'),
+    'projects': ('name',)
+}
+ENTRY_KEY_PREFIX = {'experience': 'exp', 'education': 'edu', 'projects': 'proj'}
+# Widget keys dropped when an upload replaces the form contents
+WIDGET_KEY_PREFIXES = ('exp_', 'edu_', 'proj_', 'pi_', 'list_')
+
+def _timed(section: str):
+    """Record a section's render time in session_state.rerun_timings (milliseconds)"""
+    def decorator(render):
+        @wraps(render)
+        def wrapper(*args, **kwargs):
+            started = time.perf_counter()
+            result = render(*args, **kwargs)
+            elapsed = (time.perf_counter() - started) * 1000
+            st.session_state.setdefault('rerun_timings', {})[section] = elapsed
+            logger.debug("Rendered %s in %.1f ms", section, elapsed)
+            if SHOW_RERUN_TIMING:
+                st.caption(f"⏱️ {section} rendered in {elapsed:.1f} ms")
+            return result
+        return wrapper
+    return decorator
+
+def _empty_resume_data() -> dict:
+    return {
+        'personal_info': {},
+        'experience': [],
+        'education': [],
+        'technical_skills': [],
+        'soft_skills': [],
+        'projects': [],
+        'certifications': [],
+        'languages': []
+    }
+
+def _init_entries(section: str) -> None:
+    # Form entries include incomplete ones; resume_data[section] only holds the complete ones
+    st.session_state[section] = [dict(entry) for entry in st.session_state.resume_data.get(section) or []] or [{}]
+
+def _entry_key(section: str, index: int, field: str) -> str:
+    return f"{ENTRY_KEY_PREFIX[section]}_{field}_{index}"
+
+def _sync_entries(section: str) -> None:
+    required = ENTRY_REQUIRED[section]
+    st.session_state.resume_data[section] = [
+        entry for entry in st.session_state[section] if all(entry.get(field) for field in required)
+    ]
+
+# on_change callbacks: each edit updates only its own field of resume_data. An edit reruns
+# only its fragment, never reaching the page-level autosave, so each callback saves the draft
+
+def _update_personal(field: str) -> None:
+    st.session_state.resume_data.setdefault('personal_info', {})[field] = st.session_state[f"pi_{field}"]
+    autosave_draft()
+
+def _update_entry(section: str, index: int, field: str) -> None:
+    st.session_state[section][index][field] = st.session_state[_entry_key(section, index, field)]
+    _sync_entries(section)
+    autosave_draft()
+
+def _update_list(field: str) -> None:
+    value = st.session_state[f"list_{field}"]
+    st.session_state.resume_data[field] = [item.strip() for item in value.split(',') if item.strip()]
+    autosave_draft()
+
+def _seed(key: str, value: str) -> None:
+    # Widgets are keyed only (no value=), so seed the key once from the stored data
+    if key not in st.session_state:
+        st.session_state[key] = value
+
+def _personal_input(widget, label: str, field: str, **kwargs):
+    key = f"pi_{field}"
+    _seed(key, st.session_state.resume_data.get('personal_info', {}).get(field, ''))
+    return widget(label, key=key, on_change=_update_personal, args=(field,), **kwargs)
+
+def _entry_input(widget, label: str, section: str, index: int, field: str, **kwargs):
+    key = _entry_key(section, index, field)
+    _seed(key, st.session_state[section][index].get(field, ''))
+    return widget(label, key=key, on_change=_update_entry, args=(section, index, field), **kwargs)
+
+def _list_input(label: str, field: str, **kwargs):
+    key = f"list_{field}"
+    _seed(key, ", ".join(st.session_state.resume_data.get(field, [])))
+    return st.text_area(label, key=key, on_change=_update_list, args=(field,), **kwargs)
+
+def _apply_upload() -> None:
+    uploaded_file = st.file_uploader(
+        "Upload your existing resume to auto-fill the form",
+        type=['pdf', 'docx'],
+        help="We'll parse your resume and pre-fill the information below"
+    )
+
+    if uploaded_file is None:
+        return
+    # The parsers load only once a file is uploaded
+    from utils.resume_parser import parse_resume, upload_digest
+
+    # The uploader re-delivers the file on every rerun; only apply each upload once
+    upload_id = upload_digest(uploaded_file)
+    if st.session_state.get('parsed_upload') != upload_id:
+        with st.spinner("🔍 Parsing your resume..."):
+            try:
+                parsed_data = parse_resume(uploaded_file, digest=upload_id)
+                st.session_state.parsed_upload = upload_id
+                if parsed_data:
+                    st.session_state.resume_data.update(parsed_data)
+                    # Drop stale widgets so the form picks up the parsed values
+                    for key in [key for key in st.session_state if str(key).startswith(WIDGET_KEY_PREFIXES)]:
+                        del st.session_state[key]
+                    for section in ENTRY_REQUIRED:
+                        _init_entries(section)
+                    st.success("✅ Resume parsed successfully! Form pre-filled below.")
+                    st.rerun()
+            except Exception as e:
+                st.error(f"❌ Error parsing file: {str(e)}")
+
+def _entry_buttons(section: str, noun: str) -> None:
+    entries = st.session_state[section]
+    col_add, col_remove = st.columns(2)
+    with col_add:
+        if st.button(f"➕ Add Another {noun}", key=f"add_{section}", use_container_width=True):
+            entries.append({})
+    with col_remove:
+        if len(entries) > 1 and st.button(f"🗑️ Remove Last {noun}", key=f"remove_{section}",
+                                          use_container_width=True):
+            index = len(entries) - 1
+            entries.pop()
+            prefix = f"{ENTRY_KEY_PREFIX[section]}_"
+            for key in [key for key in st.session_state if str(key).startswith(prefix) and str(key).endswith(f"_{index}")]:
+                del st.session_state[key]
+            _sync_entries(section)
+            autosave_draft()
+
+@st.fragment
+@_timed("Personal information")
+def _personal_info_section():
+    st.markdown("### 👤 Personal Information")
+
+    col1, col2 = st.columns(2)
+
+    with col1:
+        _personal_input(st.text_input, "Full Name*", 'name', placeholder="John Doe")
+        _personal_input(st.text_input, "Email Address*", 'email', placeholder="john.doe@email.com")
+        _personal_input(st.text_input, "Phone Number*", 'phone', placeholder="+1 (555) 123-4567")
+
+    with col2:
+        _personal_input(st.text_input, "LinkedIn Profile URL", 'linkedin',
+                        placeholder="https://linkedin.com/in/johndoe")
+        _personal_input(st.text_input, "GitHub/Portfolio URL", 'github', placeholder="https://github.com/johndoe")
+        _personal_input(st.text_input, "Location*", 'location', placeholder="City, State, Country")
+
+    # Professional Summary
+    st.markdown("### 📝 Professional Summary")
+    _personal_input(
+        st.text_area,
+        "Write a compelling professional summary (2-3 sentences)*",
+        'summary',
+        height=120,
+        placeholder="Experienced software engineer with 5+ years in full-stack development. Specialized in Python, React, and cloud technologies. Passionate about building scalable applications and leading cross-functional teams.",
+        help="Highlight your key achievements, skills, and career objectives"
+    )
+
+@st.fragment
+@_timed("Experience entry")
+def _experience_entry(i: int):
+    with st.expander(f"🎯 Experience {i+1}", expanded=i==0):
+        col1, col2, col3 = st.columns([2, 1, 1])
+
+        with col1:
+            _entry_input(st.text_input, "Job Title*", 'experience', i, 'title', placeholder="Senior Software Engineer")
+
+        with col2:
+            _entry_input(st.text_input, "Company*", 'experience', i, 'company', placeholder="Tech Company Inc.")
+
+        with col3:
+            col3a, col3b = st.columns(2)
+            with col3a:
+                _entry_input(st.text_input, "Start Date*", 'experience', i, 'start_date', placeholder="Jan 2020")
+            with col3b:
+                _entry_input(st.text_input, "End Date", 'experience', i, 'end_date', placeholder="Present")
+
+        _entry_input(
+            st.text_area,
+            "Description & Achievements*",
+            'experience', i, 'description',
+            height=100,
+            placeholder="• Led a team of 5 developers to deliver a new SaaS product\n• Improved application performance by 40% through optimization\n• Implemented CI/CD pipeline reducing deployment time by 60%\n• Managed project budget of $500K and delivered ahead of schedule",
+            help="Use bullet points. Focus on achievements and quantify results with numbers."
+        )
+
+@st.fragment
+@_timed("Work experience")
+def _experience_section():
+    st.markdown("### 💼 Work Experience")
+    _entry_buttons('experience', "Experience")
+    for i in range(len(st.session_state.experience)):
+        _experience_entry(i)
+
+@st.fragment
+@_timed("Education entry")
+def _education_entry(i: int):
+    with st.expander(f"📚 Education {i+1}", expanded=i==0):
+        col1, col2, col3 = st.columns([2, 1, 1])
+
+        with col1:
+            _entry_input(st.text_input, "Degree/Certificate*", 'education', i, 'degree',
+                         placeholder="Bachelor of Science in Computer Science")
+
+        with col2:
+            _entry_input(st.text_input, "Institution*", 'education', i, 'institution',
+                         placeholder="University of Technology")
+
+        with col3:
+            col3a, col3b = st.columns(2)
+            with col3a:
+                _entry_input(st.text_input, "Graduation Year*", 'education', i, 'year', placeholder="2020")
+            with col3b:
+                _entry_input(st.text_input, "GPA", 'education', i, 'gpa', placeholder="3.8/4.0")
+
+        _entry_input(st.text_input, "Relevant Coursework/Achievements", 'education', i, 'courses',
+                     placeholder="Data Structures, Algorithms, Machine Learning, Dean's List")
+
+@st.fragment
+@_timed("Education")
+def _education_section():
+    st.markdown("### 🎓 Education")
+    _entry_buttons('education', "Education")
+    for i in range(len(st.session_state.education)):
+        _education_entry(i)
+
+@st.fragment
+@_timed("Skills")
+def _skills_section():
+    st.markdown("### 🛠️ Skills")
+
+    col_skills1, col_skills2 = st.columns(2)
+
+    with col_skills1:
+        _list_input(
+            "Technical Skills*",
+            'technical_skills',
+            height=100,
+            placeholder="Python, JavaScript, React, Node.js, SQL, AWS, Docker, Git, Machine Learning, Data Analysis",
+            help="List your technical skills, programming languages, tools, and technologies"
+        )
+
+    with col_skills2:
+        _list_input(
+            "Soft Skills & Professional Skills",
+            'soft_skills',
+            height=100,
+            placeholder="Project Management, Leadership, Communication, Problem Solving, Team Collaboration, Agile Methodology",
+            help="List your soft skills and professional competencies"
+        )
+
+@st.fragment
+@_timed("Project entry")
+def _project_entry(i: int):
+    with st.expander(f"💻 Project {i+1}", expanded=i==0):
+        _entry_input(st.text_input, "Project Name*", 'projects', i, 'name', placeholder="E-commerce Platform")
+        _entry_input(st.text_input, "Project URL/GitHub", 'projects', i, 'url',
+                     placeholder="https://github.com/username/project")
+        _entry_input(
+            st.text_area,
+            "Project Description*",
+            'projects', i, 'description',
+            height=80,
+            placeholder="Developed a full-stack e-commerce platform with React and Node.js. Implemented user authentication, payment processing, and inventory management.",
+            help="Describe the project, your role, technologies used, and outcomes"
+        )
+
+@st.fragment
+@_timed("Projects")
+def _projects_section():
+    st.markdown("### 🚀 Projects")
+    _entry_buttons('projects', "Project")
+    for i in range(len(st.session_state.projects)):
+        _project_entry(i)
+
+@st.fragment
+@_timed("Certifications & languages")
+def _certifications_section():
+    st.markdown("### 🏆 Certifications & Languages")
+
+    col_cert1, col_cert2 = st.columns(2)
+
+    with col_cert1:
+        _list_input(
+            "Certifications & Awards",
+            'certifications',
+            height=80,
+            placeholder="AWS Certified Solutions Architect, Google Professional Data Engineer, Scrum Master Certification",
+            help="List relevant certifications, awards, and honors"
+        )
+
+    with col_cert2:
+        _list_input(
+            "Languages",
+            'languages',
+            height=80,
+            placeholder="English (Native), Spanish (Professional), French (Basic)",
+            help="List languages you speak and proficiency levels"
+        )
+
+def _save_and_analyze() -> None:
+    resume = Resume.from_dict(st.session_state.resume_data)
+    errors = resume.validate()
+    if errors:
+        for error in errors:
+            st.error(f"❌ {error}")
+        return
+
+    st.success("✅ Resume data saved successfully!")
+
+    # Generate AI suggestions
+    with st.spinner("🤖 Generating AI analysis and suggestions..."):
+        try:
+            analysis = get_ai_suggestions(
+                st.session_state.resume_data,
+                st.session_state.get('analyzed_resume_data'),
+                st.session_state.get('ai_analysis')
+            )
+        except Exception as e:
+            st.error(f"❌ AI analysis failed: {str(e)}")
+            # Fall back to the offline scorer, which needs no network
+            analysis = offline_analysis(st.session_state.resume_data)
+    st.session_state.ai_analysis = analysis
+
+    if is_offline_analysis(analysis):
+        # Only a model analysis is a baseline for re-analyzing edited sections
+        st.session_state.pop('analyzed_resume_data', None)
+        st.info("💡 Basic analysis provided. For full AI features, check your API configuration.")
+    else:
+        st.session_state.analyzed_resume_data = copy.deepcopy(st.session_state.resume_data)
+        st.success("🎯 AI analysis complete! Check the 'Preview & AI' page.")
+
+@_timed("Full page")
+def show_build_resume():
+    """Resume builder; each section is a fragment, so editing a field reruns only that section"""
+    st.title("📄 Build Your Resume")
+    st.markdown("---")
+
+    # Initialize session state
+    if 'resume_data' not in st.session_state:
+        st.session_state.resume_data = _empty_resume_data()
+    for section in ENTRY_REQUIRED:
+        if section not in st.session_state:
+            _init_entries(section)
+
+    # File upload section
+    st.header("📤 Upload Existing Resume (Optional)")
+    _apply_upload()
+
+    _personal_info_section()
+    _experience_section()
+    _education_section()
+    _skills_section()
+    _projects_section()
+    _certifications_section()
+
+    # resume_data is already current: every widget updates its own field as it changes
+    if st.button("🤖 Save Resume & Generate AI Analysis", type="primary", use_container_width=True):
+        _save_and_analyze()
@@ -0,0 +1,134 @@
+import hashlib
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Tuple
+
+EMAIL_RE = re.compile(r'^[^@\s]+@[^@\s]+\.[^@\s]+$')
+
+def _text(value: Any) -> str:
+    if value is None:
+        return ''
+    return value.strip() if isinstance(value, str) else str(value).strip()
+
+def _strings(values: Any) -> Tuple[str, ...]:
+    # Skill lists arrive either as lists or as the comma-separated text of the form
+    if isinstance(values, str):
+        values = values.split(',')
+    return tuple(text for text in (_text(value) for value in values or ()) if text)
+
+class _Record:
+    """Shared from_dict/to_dict for the flat string records"""
+    __slots__ = ()
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]):
+        data = data or {}
+        # Unknown keys are dropped, so stray form or parser fields never reach templates or hashes.
+        # __match_args__ is the dataclass's field names in order, without the cost of fields()
+        return cls(*[_text(data.get(name)) for name in cls.__match_args__])
+
+    def to_dict(self) -> Dict[str, str]:
+        return {name: getattr(self, name) for name in self.__match_args__}
+
+    def __bool__(self) -> bool:
+        return any(getattr(self, name) for name in self.__match_args__)
+
+@dataclass(frozen=True, slots=True)
+class PersonalInfo(_Record):
+    name: str = ''
+    email: str = ''
+    phone: str = ''
+    linkedin: str = ''
+    github: str = ''
+    location: str = ''
+    summary: str = ''
+
+@dataclass(frozen=True, slots=True)
+class Experience(_Record):
+    title: str = ''
+    company: str = ''
+    start_date: str = ''
+    end_date: str = ''
+    description: str = ''
+
+@dataclass(frozen=True, slots=True)
+class Education(_Record):
+    degree: str = ''
+    institution: str = ''
+    year: str = ''
+    gpa: str = ''
+    courses: str = ''
+
+@dataclass(frozen=True, slots=True)
+class Project(_Record):
+    name: str = ''
+    url: str = ''
+    description: str = ''
+
+@dataclass(frozen=True, slots=True)
+class Resume:
+    """Immutable resume; content_hash keys every resume cache and to_dict() is the shape templates render"""
+    personal_info: PersonalInfo = PersonalInfo()
+    experience: Tuple[Experience, ...] = ()
+    education: Tuple[Education, ...] = ()
+    technical_skills: Tuple[str, ...] = ()
+    soft_skills: Tuple[str, ...] = ()
+    projects: Tuple[Project, ...] = ()
+    certifications: Tuple[str, ...] = ()
+    languages: Tuple[str, ...] = ()
+    _hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    @classmethod
+    def from_dict(cls, data: Optional[Dict]) -> 'Resume':
+        """Build from the resume_data dict shape, dropping entries with no content"""
+        if isinstance(data, Resume):
+            return data
+        data = data or {}
+        return cls(
+            personal_info=PersonalInfo.from_dict(data.get('personal_info')),
+            experience=tuple(item for item in map(Experience.from_dict, data.get('experience') or ()) if item),
+            education=tuple(item for item in map(Education.from_dict, data.get('education') or ()) if item),
+            technical_skills=_strings(data.get('technical_skills')),
+            soft_skills=_strings(data.get('soft_skills')),
+            projects=tuple(item for item in map(Project.from_dict, data.get('projects') or ()) if item),
+            certifications=_strings(data.get('certifications')),
+            languages=_strings(data.get('languages'))
+        )
+
+    @classmethod
+    def from_json(cls, text: str) -> 'Resume':
+        return cls.from_dict(json.loads(text))
+
+    def to_dict(self) -> Dict:
+        return {
+            'personal_info': self.personal_info.to_dict(),
+            'experience': [item.to_dict() for item in self.experience],
+            'education': [item.to_dict() for item in self.education],
+            'technical_skills': list(self.technical_skills),
+            'soft_skills': list(self.soft_skills),
+            'projects': [item.to_dict() for item in self.projects],
+            'certifications': list(self.certifications),
+            'languages': list(self.languages)
+        }
+
+    def to_json(self) -> str:
+        """Compact JSON with sorted keys, so equal resumes always serialize to the same bytes"""
+        return json.dumps(self.to_dict(), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+
+    @property
+    def content_hash(self) -> str:
+        """SHA-256 of to_json(), computed once per instance"""
+        if self._hash is None:
+            object.__setattr__(self, '_hash', hashlib.sha256(self.to_json().encode('utf-8')).hexdigest())
+        return self._hash
+
+    def validate(self) -> List[str]:
+        """Problems that block saving; empty when the resume is valid"""
+        errors = []
+        personal_info = self.personal_info
+        if not personal_info.name or not personal_info.email or not personal_info.summary:
+            errors.append("Please fill in all required fields (marked with *)")
+        if personal_info.email and not EMAIL_RE.match(personal_info.email):
+            errors.append(f"'{personal_info.email}' is not a valid email address")
+        return errors
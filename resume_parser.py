@@ -1,6 +1,481 @@
 import streamlit as st
+import copy
+import hashlib
+import io
+import json
+import logging
+import os
+import re
+import time
+import zipfile
+from xml.etree import ElementTree
+from typing import Iterable, Iterator, List, Optional, Tuple
+from utils.cache import DiskJSONCache, LRUCache
+
+logger = logging.getLogger(__name__)
+
+# Bump whenever the classifier output changes so cached parses are not reused
+PARSER_VERSION = 1
+PARSE_CACHE_DIR = os.path.join("data", "parse_cache")
+PARSE_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Fan page extraction out to worker processes for documents with at least
+# PARALLEL_MIN_PAGES pages. 0 (the default) keeps extraction serial: the pool has not
+# beaten serial extraction in any measurement yet, so set a threshold only from a
+# crossover benchmarks/bench_pdf_parallel.py shows on the deployment's cores
+PARSE_WORKERS = int(os.getenv('NEURACV_PARSE_WORKERS', str(min(4, os.cpu_count() or 1))))
+PARALLEL_MIN_PAGES = int(os.getenv('NEURACV_PARALLEL_MIN_PAGES', '0'))
+
+_parsed_memory = LRUCache(max_entries=128, max_bytes=8 * 1024 * 1024,
+                          sizeof=lambda value: len(json.dumps(value, ensure_ascii=False)))
+_parsed_disk = None
+
+# Normalized heading text -> resume_data section
+SECTION_HEADINGS = {
+    'summary': 'summary',
+    'professional summary': 'summary',
+    'profile': 'summary',
+    'professional profile': 'summary',
+    'about me': 'summary',
+    'objective': 'summary',
+    'career objective': 'summary',
+    'experience': 'experience',
+    'work experience': 'experience',
+    'professional experience': 'experience',
+    'employment history': 'experience',
+    'work history': 'experience',
+    'education': 'education',
+    'academic background': 'education',
+    'education & training': 'education',
+    'skills': 'technical_skills',
+    'technical skills': 'technical_skills',
+    'core competencies': 'technical_skills',
+    'technologies': 'technical_skills',
+    'soft skills': 'soft_skills',
+    'professional skills': 'soft_skills',
+    'projects': 'projects',
+    'personal projects': 'projects',
+    'selected projects': 'projects',
+    'certifications': 'certifications',
+    'certifications & awards': 'certifications',
+    'certifications and awards': 'certifications',
+    'licenses & certifications': 'certifications',
+    'awards': 'certifications',
+    'languages': 'languages'
+}
+
+EMAIL_RE = re.compile(r'[\w.+-]+@[\w-]+\.[\w.-]+')
+PHONE_RE = re.compile(r'\+?\d[\d\s().-]{7,}\d')
+LINKEDIN_RE = re.compile(r'(?:https?://)?(?:www\.)?linkedin\.com/\S+', re.IGNORECASE)
+GITHUB_RE = re.compile(r'(?:https?://)?(?:www\.)?github\.com/\S+', re.IGNORECASE)
+URL_RE = re.compile(r'https?://\S+|(?:www\.)?github\.com/\S+', re.IGNORECASE)
+_DATE = r'(?:(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Sept|Oct|Nov|Dec)[a-z]*\.?\s+)?(?:19|20)\d{2}'
+DATE_RANGE_RE = re.compile(
+    rf'({_DATE})\s*(?:-|–|—|to)\s*({_DATE}|present|current|now)',
+    re.IGNORECASE
+)
+YEAR_RE = re.compile(r'(?:19|20)\d{2}')
+GPA_RE = re.compile(r'GPA[:\s]*([\d.]+(?:\s*/\s*[\d.]+)?)', re.IGNORECASE)
+DEGREE_RE = re.compile(
+    r'\b(?:bachelor|master|ph\.?d|doctor|associate|diploma|certificate|mba|b\.?sc?|m\.?sc?|b\.?a|m\.?a|b\.?eng|m\.?eng|b\.?tech|m\.?tech)\b',
+    re.IGNORECASE
+)
+INSTITUTION_RE = re.compile(r'\b(?:university|college|institute|school|academy|polytechnic)\b', re.IGNORECASE)
+# Loose matches for headings styled as "Heading N" in DOCX files,
+# e.g. "Relevant Work Experience" or "Skills & Tools"
+HEADING_KEYWORDS = (
+    ('experience', 'experience'),
+    ('employment', 'experience'),
+    ('education', 'education'),
+    ('soft skill', 'soft_skills'),
+    ('skill', 'technical_skills'),
+    ('project', 'projects'),
+    ('certif', 'certifications'),
+    ('award', 'certifications'),
+    ('language', 'languages'),
+    ('summary', 'summary'),
+    ('profile', 'summary'),
+    ('objective', 'summary')
+)
+_W = '{http://schemas.openxmlformats.org/wordprocessingml/2006/main}'
+BULLET_CHARS = '•●▪■◦‣-*–·'
+LIST_SPLIT_RE = re.compile(r'\s*[,;|•●▪·]\s*')
+
+def parse_resume(file, digest: Optional[str] = None) -> dict:
+    """Parse an uploaded resume into the resume_data schema, reusing earlier parses of the same bytes"""
+    file_name = getattr(file, 'name', '').lower()
+    cache_key = f"{digest or upload_digest(file)}-{os.path.splitext(file_name)[1].lstrip('.')}-v{PARSER_VERSION}"
+
+    resume_data = _parsed_memory.get(cache_key)
+    if resume_data is None:
+        resume_data = _disk_cache().get(cache_key)
+        if resume_data is not None:
+            _parsed_memory.put(cache_key, resume_data)
+
+    if resume_data is None:
+        resume_data = _parse_upload(file, file_name)
+        if resume_data is None:
+            return {}
+        _parsed_memory.put(cache_key, resume_data)
+        _disk_cache().put(cache_key, resume_data)
+
+    # Callers mutate the lists they get back, so never hand out the cached object
+    return copy.deepcopy(resume_data)
+
+def upload_digest(file) -> str:
+    """SHA-256 of an uploaded file, read in chunks"""
+    digest = hashlib.sha256()
+    file.seek(0)
+    for chunk in iter(lambda: file.read(1024 * 1024), b''):
+        digest.update(chunk)
+    file.seek(0)
+    return digest.hexdigest()
+
+def parse_cache_stats() -> dict:
+    """Hit/miss counters of the in-memory parse cache"""
+    return _parsed_memory.stats()
+
+def _disk_cache() -> DiskJSONCache:
+    global _parsed_disk
+    if _parsed_disk is None:
+        _parsed_disk = DiskJSONCache(PARSE_CACHE_DIR, max_bytes=PARSE_CACHE_MAX_BYTES)
+    return _parsed_disk
+
+def _parse_upload(file, file_name: str) -> Optional[dict]:
+    """Parse an upload, returning None when the file type cannot be parsed here"""
+    if file_name.endswith('.pdf'):
+        try:
+            pages = iter_pdf_pages(file)
+            timings = []
+            resume_data = lines_to_resume_data(_timed_lines(pages, timings))
+        except ImportError:
+            st.warning("📄 PDF parsing needs the `pypdf` package. Please fill in the form below.")
+            return None
+        _report_timings(timings)
+        return resume_data
+
+    if file_name.endswith('.docx'):
+        return lines_to_resume_data(_docx_lines(iter_docx_paragraphs(file)))
 
-def parse_resume(file) -> dict:
-    """Mock resume parser"""
     st.info("📄 File uploaded successfully! Please fill in the form below.")
-    return {}
\ No newline at end of file
+    return None
+
+def iter_pdf_pages(file, workers: Optional[int] = None) -> Iterator[Tuple[int, str, float]]:
+    """Yield (page number, text, seconds) in page order, one page at a time"""
+    from pypdf import PdfReader
+
+    workers = PARSE_WORKERS if workers is None else workers
+
+    # PdfReader resolves objects from the stream on demand, so only the page
+    # currently being extracted is materialized
+    reader = PdfReader(file)
+    page_count = len(reader.pages)
+    if PARALLEL_MIN_PAGES and workers > 1 and page_count >= PARALLEL_MIN_PAGES:
+        yield from _iter_pdf_pages_parallel(file, page_count, workers)
+        return
+
+    for page_number in range(page_count):
+        started = time.perf_counter()
+        text = reader.pages[page_number].extract_text() or ''
+        yield page_number + 1, text, time.perf_counter() - started
+
+def _iter_pdf_pages_parallel(file, page_count: int, workers: int) -> Iterator[Tuple[int, str, float]]:
+    # multiprocessing is only needed for large PDFs, so it stays out of the import path
+    import multiprocessing
+    from concurrent.futures import ProcessPoolExecutor
+
+    file.seek(0)
+    pdf_bytes = file.read()
+    # Two batches per worker keeps the pool busy when pages differ in cost
+    batch_size = max(1, -(-page_count // (workers * 2)))
+    # Forking a threaded Streamlit server is unsafe; spawned workers start clean
+    with ProcessPoolExecutor(max_workers=workers, mp_context=multiprocessing.get_context('spawn')) as pool:
+        batches = [
+            pool.submit(_extract_page_range, pdf_bytes, start, min(start + batch_size, page_count))
+            for start in range(0, page_count, batch_size)
+        ]
+        for batch in batches:
+            yield from batch.result()
+
+def _extract_page_range(pdf_bytes: bytes, start: int, stop: int) -> List[Tuple[int, str, float]]:
+    """Worker entry point: extract pages [start, stop) of a PDF"""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    pages = []
+    for page_index in range(start, stop):
+        started = time.perf_counter()
+        text = reader.pages[page_index].extract_text() or ''
+        pages.append((page_index + 1, text, time.perf_counter() - started))
+    return pages
+
+def iter_docx_paragraphs(file) -> Iterator[Tuple[str, str]]:
+    """Yield (style, text) for each paragraph of a DOCX file without loading the whole document"""
+    with zipfile.ZipFile(file) as archive, archive.open('word/document.xml') as document:
+        stack = []
+        paragraph_depth = 0
+        for event, elem in ElementTree.iterparse(document, events=('start', 'end')):
+            if event == 'start':
+                stack.append(elem)
+                if elem.tag == f'{_W}p':
+                    paragraph_depth += 1
+                continue
+
+            stack.pop()
+            if elem.tag == f'{_W}p':
+                paragraph_depth -= 1
+                yield _paragraph_style(elem), _paragraph_text(elem)
+            # Runs stay attached until their paragraph ends; everything else is
+            # released as soon as it closes so memory stays flat
+            if paragraph_depth == 0:
+                elem.clear()
+                if stack:
+                    stack[-1].remove(elem)
+
+def _paragraph_style(paragraph) -> str:
+    style = paragraph.find(f'{_W}pPr/{_W}pStyle')
+    return style.get(f'{_W}val', '') if style is not None else ''
+
+def _paragraph_text(paragraph) -> str:
+    parts = []
+    for node in paragraph.iter():
+        if node.tag == f'{_W}t' and node.text:
+            parts.append(node.text)
+        elif node.tag == f'{_W}tab':
+            parts.append('\t')
+        elif node.tag in (f'{_W}br', f'{_W}cr'):
+            parts.append('\n')
+    return ''.join(parts)
+
+def _docx_lines(paragraphs: Iterable[Tuple[str, str]]) -> Iterator[str]:
+    for style, text in paragraphs:
+        style = style.lower()
+        if (style.startswith('heading') or style == 'title') and not detect_heading(text):
+            section = _heading_section(text)
+            if section:
+                # Emit the canonical heading so the line classifier switches section
+                yield next(heading for heading, target in SECTION_HEADINGS.items() if target == section)
+                continue
+        yield from text.splitlines()
+
+def _heading_section(text: str) -> str:
+    lowered = text.lower()
+    for keyword, section in HEADING_KEYWORDS:
+        if keyword in lowered:
+            return section
+    return ''
+
+def _timed_lines(pages: Iterable[Tuple[int, str, float]], timings: List[Tuple[int, float]]) -> Iterator[str]:
+    for page_number, text, elapsed in pages:
+        timings.append((page_number, elapsed))
+        logger.info("Extracted page %d in %.1f ms", page_number, elapsed * 1000)
+        yield from text.splitlines()
+
+def _report_timings(timings: List[Tuple[int, float]]) -> None:
+    if not timings:
+        return
+    total_ms = sum(elapsed for _, elapsed in timings) * 1000
+    slowest_page, slowest = max(timings, key=lambda timing: timing[1])
+    st.caption(
+        f"⏱️ Extracted {len(timings)} page(s) in {total_ms:.0f} ms "
+        f"(slowest: page {slowest_page}, {slowest * 1000:.0f} ms)"
+    )
+
+def detect_heading(line: str) -> str:
+    """Return the resume_data section a heading line introduces, or an empty string"""
+    normalized = re.sub(r'\s+', ' ', line.strip().strip(':').strip()).lower()
+    if not normalized or len(normalized) > 40:
+        return ''
+    return SECTION_HEADINGS.get(normalized, '')
+
+def lines_to_resume_data(lines: Iterable[str]) -> dict:
+    """Classify a stream of text lines into resume_data sections"""
+    header_lines = []
+    section_lines = {}
+    current = 'header'
+
+    for raw_line in lines:
+        line = raw_line.strip()
+        if not line:
+            continue
+        section = detect_heading(line)
+        if section:
+            current = section
+            continue
+        if current == 'header':
+            header_lines.append(line)
+        else:
+            section_lines.setdefault(current, []).append(line)
+
+    return sections_to_resume_data(header_lines, section_lines)
+
+def sections_to_resume_data(header_lines: List[str], section_lines: dict) -> dict:
+    """Build resume_data from header lines and lines grouped by section"""
+    personal_info = _parse_header(header_lines)
+    if section_lines.get('summary'):
+        personal_info['summary'] = ' '.join(section_lines['summary'])
+
+    resume_data = {
+        'personal_info': personal_info,
+        'experience': _parse_experience(section_lines.get('experience', [])),
+        'education': _parse_education(section_lines.get('education', [])),
+        'technical_skills': _parse_list(section_lines.get('technical_skills', [])),
+        'soft_skills': _parse_list(section_lines.get('soft_skills', [])),
+        'projects': _parse_projects(section_lines.get('projects', [])),
+        'certifications': _parse_list(section_lines.get('certifications', [])),
+        'languages': _parse_list(section_lines.get('languages', []))
+    }
+
+    # Only return what was found so existing form data is not wiped out
+    return {key: value for key, value in resume_data.items() if value}
+
+def _parse_header(lines: List[str]) -> dict:
+    personal_info = {}
+    leftover = []
+
+    for line in lines:
+        matched = False
+        for field, pattern in (('email', EMAIL_RE), ('linkedin', LINKEDIN_RE), ('github', GITHUB_RE), ('phone', PHONE_RE)):
+            match = pattern.search(line)
+            if match and field not in personal_info:
+                personal_info[field] = match.group(0).strip()
+                matched = True
+        if matched:
+            continue
+        if 'name' not in personal_info:
+            personal_info['name'] = line
+        elif 'location' not in personal_info and ',' in line and len(line) < 60:
+            personal_info['location'] = line
+        else:
+            leftover.append(line)
+
+    # Text between the contact block and the first heading is usually the summary
+    if leftover:
+        personal_info['summary'] = ' '.join(leftover)
+    return personal_info
+
+def _is_bullet(line: str) -> bool:
+    return line[0] in BULLET_CHARS
+
+def _strip_bullet(line: str) -> str:
+    return line.lstrip(BULLET_CHARS).strip()
+
+def _split_title_company(text: str) -> Tuple[str, str]:
+    for separator in (' at ', ' | ', ' @ ', ' - ', ' – ', ', '):
+        if separator in text:
+            title, company = text.split(separator, 1)
+            return title.strip(), company.strip(' ,|-–')
+    return text.strip(), ''
+
+def _finish_entry(entries: list, entry: dict, description: list) -> None:
+    if description:
+        entry['description'] = '\n'.join(description)
+    if any(entry.values()):
+        entries.append(entry)
+
+def _parse_experience(lines: List[str]) -> list:
+    entries = []
+    entry, description = {}, []
+
+    for line in lines:
+        date_match = DATE_RANGE_RE.search(line)
+        if date_match:
+            if entry.get('start_date'):
+                _finish_entry(entries, entry, description)
+                entry, description = {}, []
+            entry['start_date'] = date_match.group(1)
+            entry['end_date'] = date_match.group(2)
+            rest = (line[:date_match.start()] + line[date_match.end():]).strip(' ,|-–()')
+            if rest:
+                if not entry.get('title'):
+                    entry['title'], entry['company'] = _split_title_company(rest)
+                elif not entry.get('company'):
+                    entry['company'] = rest
+        elif _is_bullet(line):
+            description.append('• ' + _strip_bullet(line))
+        elif not entry.get('title') or description:
+            if description:
+                _finish_entry(entries, entry, description)
+                entry, description = {}, []
+            entry['title'], entry['company'] = _split_title_company(line)
+        elif not entry.get('company'):
+            entry['company'] = line
+        else:
+            description.append(line)
+
+    _finish_entry(entries, entry, description)
+    return [entry for entry in entries if entry.get('title')]
+
+def _parse_education(lines: List[str]) -> list:
+    entries = []
+    entry = {}
+
+    for line in lines:
+        is_degree = bool(DEGREE_RE.search(line))
+        is_institution = bool(INSTITUTION_RE.search(line))
+        if (is_degree and entry.get('degree')) or (is_institution and not is_degree and entry.get('institution')):
+            entries.append(entry)
+            entry = {}
+
+        gpa_match = GPA_RE.search(line)
+        if gpa_match:
+            entry['gpa'] = gpa_match.group(1)
+            line = (line[:gpa_match.start()] + line[gpa_match.end():]).strip(' ,|-–')
+        year_match = YEAR_RE.findall(line)
+        if year_match:
+            entry['year'] = year_match[-1]
+            line = YEAR_RE.sub('', line).strip(' ,|-–()')
+        if not line:
+            continue
+
+        if is_degree and not entry.get('degree'):
+            degree, institution = _split_title_company(line) if is_institution else (line, '')
+            entry['degree'] = degree
+            if institution:
+                entry['institution'] = institution
+        elif is_institution and not entry.get('institution'):
+            entry['institution'] = line
+        else:
+            courses = entry.get('courses')
+            text = _strip_bullet(line)
+            entry['courses'] = f"{courses}, {text}" if courses else text
+
+    if entry:
+        entries.append(entry)
+    return [entry for entry in entries if entry.get('degree') or entry.get('institution')]
+
+def _parse_projects(lines: List[str]) -> list:
+    entries = []
+    entry, description = {}, []
+
+    for line in lines:
+        url_match = URL_RE.search(line)
+        if url_match and not entry.get('url'):
+            entry['url'] = url_match.group(0)
+            line = (line[:url_match.start()] + line[url_match.end():]).strip(' ,|-–()')
+            if not line:
+                continue
+        if _is_bullet(line):
+            description.append('• ' + _strip_bullet(line))
+        elif not entry.get('name'):
+            entry['name'] = line
+        elif description:
+            _finish_entry(entries, entry, description)
+            entry, description = {'name': line}, []
+        else:
+            description.append(line)
+
+    _finish_entry(entries, entry, description)
+    return [entry for entry in entries if entry.get('name')]
+
+def _parse_list(lines: List[str]) -> list:
+    items = []
+    for line in lines:
+        # "Programming: Python, Go" -> "Python, Go"
+        if ':' in line and not URL_RE.search(line):
+            line = line.split(':', 1)[1]
+        for item in LIST_SPLIT_RE.split(_strip_bullet(line)):
+            item = item.strip()
+            if item and item not in items:
+                items.append(item)
+    return items
@@ -11,6 +11,10 @@ mkdir -p templates static/css static/images data utils tests
 echo "Installing dependencies..."
 pip install -r requirements.txt
 
+# Precompile resume templates so workers start with a warm template cache
+echo "Precompiling templates..."
+python -m utils.template_engine
+
 # Set up environment variables
 if [ ! -f .env ]; then
     echo "Creating .env file..."
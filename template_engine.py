@@ -1,159 +1,313 @@
 import streamlit as st
-from jinja2 import Template
+from streamlit.runtime.scriptrunner import get_script_run_ctx
+from jinja2 import Environment, FileSystemBytecodeCache, FileSystemLoader, TemplateNotFound
+import gzip
+import io
+import logging
 import os
+from typing import Iterator, Optional
+from utils.cache import LRUCache, canonical_hash
+from utils.html_output import minify_stream
+from utils.resume_model import Resume
+
+logger = logging.getLogger(__name__)
+
+TEMPLATES_DIR = "templates"
+BYTECODE_CACHE_DIR = os.getenv('NEURACV_TEMPLATE_CACHE_DIR', os.path.join("data", "template_cache"))
+
+# Bump whenever the markup produced by render_basic_template changes
+BASIC_TEMPLATE_VERSION = 3
+
+# Characters per chunk when writing cached HTML out
+STREAM_CHUNK_SIZE = 64 * 1024
+
+class _StatCheckingLoader(FileSystemLoader):
+    """File loader whose templates are considered stale once mtime or size changes"""
+
+    def get_source(self, environment, template):
+        source, filename, _ = super().get_source(environment, template)
+        stamp = _file_stamp(filename)
+
+        def uptodate() -> bool:
+            return _file_stamp(filename) == stamp
+
+        return source, filename, uptodate
+
+def _file_stamp(path: str):
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return stat.st_mtime_ns, stat.st_size
+
+def _create_environment() -> Environment:
+    os.makedirs(BYTECODE_CACHE_DIR, exist_ok=True)
+    return Environment(
+        loader=_StatCheckingLoader(TEMPLATES_DIR, encoding='utf-8'),
+        bytecode_cache=FileSystemBytecodeCache(BYTECODE_CACHE_DIR),
+        auto_reload=True,
+        cache_size=100
+    )
+
+def _load_registered_templates() -> list:
+    """Load every registered template that exists on disk into the environment"""
+    loaded = []
+    for template_name in get_all_templates():
+        try:
+            _environment.get_template(f"{template_name}.html")
+        except TemplateNotFound:
+            continue
+        loaded.append(template_name)
+    return loaded
+
+def precompile_templates() -> list:
+    """Compile all registered templates into the bytecode cache ahead of time"""
+    create_template_files()
+    return _load_registered_templates()
+
+# Shared by every session in the process; Jinja's template cache is thread-safe
+_environment = _create_environment()
+
+# Rendered HTML keyed by (template, template version, resume content hash, improved)
+_render_cache = LRUCache(max_entries=512, max_bytes=32 * 1024 * 1024)
+
+def render_cache_stats() -> dict:
+    """Hit/miss counters and size of the rendered HTML cache"""
+    return {'pages': _render_cache.stats()}
+
+def _report_template_error(error: Exception) -> None:
+    # Background renders (the template gallery's pool) have no script run to show an error in
+    if get_script_run_ctx(suppress_warning=True) is None:
+        logger.warning("Error loading template: %s", error)
+    else:
+        st.error(f"Error loading template: {str(error)}")
 
 def render_template(template_name: str, resume_data: dict, improved: bool = False) -> str:
     """Render resume template with data"""
+    resume = Resume.from_dict(_resolve_improved(resume_data, improved))
+    
+    try:
+        template = _environment.get_template(f"{template_name}.html")
+    except TemplateNotFound:
+        # If template file doesn't exist, use basic template
+        return render_basic_template(resume, improved)
+    except Exception as e:
+        _report_template_error(e)
+        return render_basic_template(resume, improved)
+    
+    cache_key = _render_key(template_name, template, resume, improved)
+    html = _render_cache.get(cache_key)
+    if html is not None:
+        return html
     
+    # Templates render the normalized dict, so resumes sharing a content hash share a page
+    data = resume.to_dict()
+    try:
+        html = template.render(
+            data=data,
+            improved=improved,
+            **data
+        )
+    except Exception as e:
+        _report_template_error(e)
+        return render_basic_template(resume, improved)
+    
+    _render_cache.put(cache_key, html)
+    return html
+
+def _render_key(template_name: str, template, resume: Resume, improved: bool) -> str:
+    return canonical_hash(template_name, _file_stamp(template.filename), resume.content_hash, improved)
+
+def template_version(template_name: str):
+    """Stamp that changes whenever the markup template_name renders can change"""
+    try:
+        template = _environment.get_template(f"{template_name}.html")
+    except TemplateNotFound:
+        return ('__basic__', BASIC_TEMPLATE_VERSION)
+    return _file_stamp(template.filename)
+
+def _resolve_improved(resume_data: dict, improved: bool) -> dict:
     # If improved version is requested and available, use it
     if improved and 'ai_analysis' in st.session_state:
         improved_content = st.session_state.ai_analysis.get('improved_content', {})
         if improved_content:
-            resume_data = improved_content
+            return improved_content
+    return resume_data
+
+def stream_template(template_name: str, resume_data: dict, improved: bool = False) -> Iterator[str]:
+    """Render resume template as a sequence of HTML chunks without building the whole page.
+    Template errors are raised to the caller, possibly after the first chunks"""
+    resume = Resume.from_dict(_resolve_improved(resume_data, improved))
     
-    template_file = f"templates/{template_name}.html"
+    try:
+        template = _environment.get_template(f"{template_name}.html")
+    except TemplateNotFound:
+        yield from _basic_template_chunks(resume.to_dict(), improved)
+        return
     
-    # If template file doesn't exist, use basic template
-    if not os.path.exists(template_file):
-        return render_basic_template(resume_data, improved)
+    html = _render_cache.get(_render_key(template_name, template, resume, improved))
+    if html is not None:
+        # Already rendered for the preview; writing it out is cheaper than rendering again
+        for start in range(0, len(html), STREAM_CHUNK_SIZE):
+            yield html[start:start + STREAM_CHUNK_SIZE]
+        return
     
+    data = resume.to_dict()
+    yield from template.generate(
+        data=data,
+        improved=improved,
+        **data
+    )
+
+def _write_chunks(fp, chunks: Iterator[str], minify: bool, compress: bool) -> None:
+    # Fixed mtime so the same resume always downloads as the same bytes
+    out = gzip.GzipFile(fileobj=fp, mode='wb', compresslevel=9, mtime=0) if compress else fp
     try:
-        with open(template_file, 'r', encoding='utf-8') as f:
-            template_content = f.read()
-        
-        template = Template(template_content)
-        return template.render(
-            data=resume_data,
-            improved=improved,
-            **resume_data
-        )
+        for chunk in minify_stream(chunks) if minify else chunks:
+            out.write(chunk.encode('utf-8'))
+    finally:
+        if compress:
+            # Writes the gzip trailer; fp itself stays open
+            out.close()
+
+def render_template_to_file(template_name: str, resume_data: dict, improved: bool = False,
+                            fp: Optional[object] = None, minify: bool = False, compress: bool = False):
+    """Stream rendered resume HTML as UTF-8 into a binary file object, a BytesIO by default,
+    optionally minified and gzipped on the way"""
+    if fp is None:
+        # st.download_button accepts BytesIO but not SpooledTemporaryFile
+        fp = io.BytesIO()
+    start = fp.tell()
+    
+    try:
+        _write_chunks(fp, stream_template(template_name, resume_data, improved), minify, compress)
     except Exception as e:
-        st.error(f"Error loading template: {str(e)}")
-        return render_basic_template(resume_data, improved)
+        # The template failed partway through; replace what was written with the basic template
+        _report_template_error(e)
+        fp.seek(start)
+        fp.truncate()
+        resume = Resume.from_dict(_resolve_improved(resume_data, improved))
+        basic_chunks = _basic_template_chunks(resume.to_dict(), improved)
+        _write_chunks(fp, basic_chunks, minify, compress)
+    fp.seek(start)
+    return fp
 
 def render_basic_template(resume_data: dict, improved: bool = False) -> str:
     """Basic HTML template as fallback"""
-    personal_info = resume_data.get('personal_info', {})
-    experience = resume_data.get('experience', [])
-    education = resume_data.get('education', [])
-    technical_skills = resume_data.get('technical_skills', [])
-    soft_skills = resume_data.get('soft_skills', [])
-    projects = resume_data.get('projects', [])
-    certifications = resume_data.get('certifications', [])
-    languages = resume_data.get('languages', [])
-    
+    resume = Resume.from_dict(resume_data)
+    cache_key = canonical_hash('__basic__', BASIC_TEMPLATE_VERSION, resume.content_hash, improved)
+    html = _render_cache.get(cache_key)
+    if html is None:
+        html = _build_basic_template(resume.to_dict(), improved)
+        _render_cache.put(cache_key, html)
+    return html
+
+_BASIC_TEMPLATE_CSS = """
+        body {
+            font-family: 'Segoe UI', Arial, sans-serif;
+            line-height: 1.6;
+            color: #333;
+            max-width: 800px;
+            margin: 0 auto;
+            padding: 20px;
+            background-color: #f9f9f9;
+        }
+        .resume-container {
+            background: white;
+            padding: 40px;
+            border-radius: 10px;
+            box-shadow: 0 2px 10px rgba(0,0,0,0.1);
+        }
+        .header {
+            text-align: center;
+            border-bottom: 3px solid #2E86AB;
+            padding-bottom: 20px;
+            margin-bottom: 30px;
+        }
+        .name {
+            font-size: 32px;
+            font-weight: bold;
+            color: #2E86AB;
+            margin: 0;
+        }
+        .improved-badge {
+            background: #4CAF50;
+            color: white;
+            padding: 5px 10px;
+            border-radius: 15px;
+            font-size: 12px;
+            margin-left: 10px;
+        }
+        .contact-info {
+            color: #666;
+            margin-top: 10px;
+            font-size: 14px;
+        }
+        .section {
+            margin: 25px 0;
+        }
+        .section-title {
+            font-size: 20px;
+            font-weight: bold;
+            color: #2E86AB;
+            border-bottom: 2px solid #e0e0e0;
+            padding-bottom: 8px;
+            margin-bottom: 15px;
+        }
+        .experience-item, .education-item, .project-item {
+            margin: 15px 0;
+            padding-left: 10px;
+            border-left: 3px solid #2E86AB;
+        }
+        .job-title {
+            font-weight: bold;
+            font-size: 16px;
+            color: #333;
+        }
+        .company {
+            color: #666;
+            font-style: italic;
+        }
+        .date {
+            color: #888;
+            font-size: 14px;
+        }
+        .skills-container {
+            display: flex;
+            flex-wrap: wrap;
+            gap: 8px;
+            margin-top: 10px;
+        }
+        .skill-tag {
+            background: #2E86AB;
+            color: white;
+            padding: 5px 12px;
+            border-radius: 20px;
+            font-size: 14px;
+        }
+        .soft-skill-tag {
+            background: #A23B72;
+            color: white;
+            padding: 5px 12px;
+            border-radius: 20px;
+            font-size: 14px;
+        }
+        .project-link {
+            color: #2E86AB;
+            text-decoration: none;
+        }
+        .project-link:hover {
+            text-decoration: underline;
+        }
+
+"""
+
+def _build_header(personal_info: dict, improved: bool) -> str:
     improved_badge = "🎯 AI-IMPROVED VERSION" if improved else ""
-    
-    html = f"""
-    <!DOCTYPE html>
-    <html>
-    <head>
-        <meta charset="UTF-8">
-        <title>{personal_info.get('name', 'Resume')}</title>
-        <style>
-            body {{
-                font-family: 'Segoe UI', Arial, sans-serif;
-                line-height: 1.6;
-                color: #333;
-                max-width: 800px;
-                margin: 0 auto;
-                padding: 20px;
-                background-color: #f9f9f9;
-            }}
-            .resume-container {{
-                background: white;
-                padding: 40px;
-                border-radius: 10px;
-                box-shadow: 0 2px 10px rgba(0,0,0,0.1);
-            }}
-            .header {{
-                text-align: center;
-                border-bottom: 3px solid #2E86AB;
-                padding-bottom: 20px;
-                margin-bottom: 30px;
-            }}
-            .name {{
-                font-size: 32px;
-                font-weight: bold;
-                color: #2E86AB;
-                margin: 0;
-            }}
-            .improved-badge {{
-                background: #4CAF50;
-                color: white;
-                padding: 5px 10px;
-                border-radius: 15px;
-                font-size: 12px;
-                margin-left: 10px;
-            }}
-            .contact-info {{
-                color: #666;
-                margin-top: 10px;
-                font-size: 14px;
-            }}
-            .section {{
-                margin: 25px 0;
-            }}
-            .section-title {{
-                font-size: 20px;
-                font-weight: bold;
-                color: #2E86AB;
-                border-bottom: 2px solid #e0e0e0;
-                padding-bottom: 8px;
-                margin-bottom: 15px;
-            }}
-            .experience-item, .education-item, .project-item {{
-                margin: 15px 0;
-                padding-left: 10px;
-                border-left: 3px solid #2E86AB;
-            }}
-            .job-title {{
-                font-weight: bold;
-                font-size: 16px;
-                color: #333;
-            }}
-            .company {{
-                color: #666;
-                font-style: italic;
-            }}
-            .date {{
-                color: #888;
-                font-size: 14px;
-            }}
-            .skills-container {{
-                display: flex;
-                flex-wrap: wrap;
-                gap: 8px;
-                margin-top: 10px;
-            }}
-            .skill-tag {{
-                background: #2E86AB;
-                color: white;
-                padding: 5px 12px;
-                border-radius: 20px;
-                font-size: 14px;
-            }}
-            .soft-skill-tag {{
-                background: #A23B72;
-                color: white;
-                padding: 5px 12px;
-                border-radius: 20px;
-                font-size: 14px;
-            }}
-            .project-link {{
-                color: #2E86AB;
-                text-decoration: none;
-            }}
-            .project-link:hover {{
-                text-decoration: underline;
-            }}
-        </style>
-    </head>
-    <body>
-        <div class="resume-container">
+    return f"""
             <div class="header">
                 <div class="name">
-                    {personal_info.get('name', 'Your Name')}
+                    {personal_info.get('name') or 'Your Name'}
                     {f'<span class="improved-badge">{improved_badge}</span>' if improved_badge else ''}
                 </div>
                 <div class="contact-info">
@@ -164,94 +318,104 @@ def render_basic_template(resume_data: dict, improved: bool = False) -> str:
                     {('<br>GitHub: ' + personal_info.get('github', '')) if personal_info.get('github') else ''}
                 </div>
             </div>
-            
+    """
+
+def _build_summary(summary: str) -> str:
+    return f"""
             <div class="section">
                 <div class="section-title">Professional Summary</div>
-                <p>{personal_info.get('summary', 'Professional summary not provided.')}</p>
+                <p>{summary}</p>
             </div>
-            
-            {f'''
-            <div class="section">
-                <div class="section-title">Work Experience</div>
-                {"".join([f'''
+    """
+
+def _build_experience_item(exp: dict) -> str:
+    return f"""
                 <div class="experience-item">
-                    <div class="job-title">{exp.get('title', 'Position')}</div>
-                    <div class="company">{exp.get('company', 'Company')}</div>
-                    <div class="date">{exp.get('start_date', '')} - {exp.get('end_date', 'Present')}</div>
-                    <p>{exp.get('description', 'Description not provided.')}</p>
+                    <div class="job-title">{exp.get('title') or 'Position'}</div>
+                    <div class="company">{exp.get('company') or 'Company'}</div>
+                    <div class="date">{exp.get('start_date', '')} - {exp.get('end_date') or 'Present'}</div>
+                    <p>{exp.get('description') or 'Description not provided.'}</p>
                 </div>
-                ''' for exp in experience])}
-            </div>
-            ''' if experience else ''}
-            
-            {f'''
-            <div class="section">
-                <div class="section-title">Education</div>
-                {"".join([f'''
+    """
+
+def _build_education_item(edu: dict) -> str:
+    return f"""
                 <div class="education-item">
-                    <div class="job-title">{edu.get('degree', 'Degree')}</div>
-                    <div class="company">{edu.get('institution', 'Institution')}</div>
-                    <div class="date">{edu.get('year', 'Year')}{' | GPA: ' + edu.get('gpa', '') if edu.get('gpa') else ''}</div>
+                    <div class="job-title">{edu.get('degree') or 'Degree'}</div>
+                    <div class="company">{edu.get('institution') or 'Institution'}</div>
+                    <div class="date">{edu.get('year') or 'Year'}{' | GPA: ' + edu.get('gpa', '') if edu.get('gpa') else ''}</div>
                     {('<p><em>Relevant coursework: ' + edu.get('courses', '') + '</em></p>') if edu.get('courses') else ''}
                 </div>
-                ''' for edu in education])}
-            </div>
-            ''' if education else ''}
-            
-            {(f'''
-            <div class="section">
-                <div class="section-title">Technical Skills</div>
-                <div class="skills-container">
-                    {"".join([f'<div class="skill-tag">{skill}</div>' for skill in technical_skills])}
-                </div>
-            </div>
-            ''') if technical_skills else ''}
-            
-            {(f'''
-            <div class="section">
-                <div class="section-title">Soft Skills</div>
-                <div class="skills-container">
-                    {"".join([f'<div class="soft-skill-tag">{skill}</div>' for skill in soft_skills])}
-                </div>
-            </div>
-            ''') if soft_skills else ''}
-            
-            {f'''
-            <div class="section">
-                <div class="section-title">Projects</div>
-                {"".join([f'''
+    """
+
+def _build_project_item(project: dict) -> str:
+    return f"""
                 <div class="project-item">
-                    <div class="job-title">{project.get('name', 'Project')}</div>
-                    {('<div><a href="{project.get("url", "")}" class="project-link">View Project</a></div>') if project.get('url') else ''}
-                    <p>{project.get('description', 'Description not provided.')}</p>
+                    <div class="job-title">{project.get('name') or 'Project'}</div>
+                    {f'<div><a href="{project.get("url", "")}" class="project-link">View Project</a></div>' if project.get('url') else ''}
+                    <p>{project.get('description') or 'Description not provided.'}</p>
                 </div>
-                ''' for project in projects])}
-            </div>
-            ''' if projects else ''}
-            
-            {(f'''
+    """
+
+def _build_tag_section(title: str, tag_class: str, items: list) -> str:
+    tags = "".join(f'<div class="{tag_class}">{item}</div>' for item in items)
+    return f"""
             <div class="section">
-                <div class="section-title">Certifications & Awards</div>
+                <div class="section-title">{title}</div>
                 <div class="skills-container">
-                    {"".join([f'<div class="skill-tag">{cert}</div>' for cert in certifications])}
+                    {tags}
                 </div>
             </div>
-            ''') if certifications else ''}
-            
-            {(f'''
+    """
+
+def _item_section(title: str, build, items: list) -> str:
+    # Building an entry is a single f-string, cheaper than hashing it for a cache lookup
+    if not items:
+        return ''
+    entries = "".join(build(item) for item in items)
+    return f"""
             <div class="section">
-                <div class="section-title">Languages</div>
-                <div class="skills-container">
-                    {"".join([f'<div class="soft-skill-tag">{lang}</div>' for lang in languages])}
-                </div>
+                <div class="section-title">{title}</div>
+                {entries}
             </div>
-            ''') if languages else ''}
+    """
+
+def _tag_section(title: str, tag_class: str, items: list) -> str:
+    if not items:
+        return ''
+    return _build_tag_section(title, tag_class, items)
+
+def _build_basic_template(resume_data: dict, improved: bool) -> str:
+    return "".join(_basic_template_chunks(resume_data, improved))
+
+def _basic_template_chunks(resume_data: dict, improved: bool) -> Iterator[str]:
+    personal_info = resume_data.get('personal_info', {})
+    
+    yield f"""
+    <!DOCTYPE html>
+    <html>
+    <head>
+        <meta charset="UTF-8">
+        <title>{personal_info.get('name') or 'Resume'}</title>
+        <style>{_BASIC_TEMPLATE_CSS}</style>
+    </head>
+    <body>
+        <div class="resume-container">
+            """
+    yield _build_header(personal_info, improved)
+    yield _build_summary(personal_info.get('summary') or 'Professional summary not provided.')
+    yield _item_section('Work Experience', _build_experience_item, resume_data.get('experience', []))
+    yield _item_section('Education', _build_education_item, resume_data.get('education', []))
+    yield _tag_section('Technical Skills', 'skill-tag', resume_data.get('technical_skills', []))
+    yield _tag_section('Soft Skills', 'soft-skill-tag', resume_data.get('soft_skills', []))
+    yield _item_section('Projects', _build_project_item, resume_data.get('projects', []))
+    yield _tag_section('Certifications & Awards', 'skill-tag', resume_data.get('certifications', []))
+    yield _tag_section('Languages', 'soft-skill-tag', resume_data.get('languages', []))
+    yield """
         </div>
     </body>
     </html>
     """
-    
-    return html
 
 def get_all_templates() -> dict:
     """Get all available templates"""
@@ -278,7 +442,7 @@ def get_all_templates() -> dict:
 
 def create_template_files():
     """Create basic template files if they don't exist"""
-    templates_dir = "templates"
+    templates_dir = TEMPLATES_DIR
     if not os.path.exists(templates_dir):
         os.makedirs(templates_dir)
     
@@ -351,4 +515,12 @@ def create_template_files():
     with open(os.path.join(templates_dir, "professional.html"), "w", encoding="utf-8") as f:
         f.write(professional_html)
     
-    return True
\ No newline at end of file
+    return True
+
+# Precompiled bytecode (see precompile_templates) makes this a cheap unmarshal
+# rather than a parse and compile, so a fresh worker serves its first preview warm
+_load_registered_templates()
+
+if __name__ == "__main__":
+    compiled = precompile_templates()
+    print(f"Precompiled {len(compiled)} template(s) into {BYTECODE_CACHE_DIR}: {', '.join(compiled)}")
@@ -0,0 +1,110 @@
+import copy
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+from utils.cache import LRUCache, canonical_hash
+from utils.html_output import preview_html
+from utils.resume_model import Resume
+from utils.template_engine import get_all_templates, render_template, template_version
+
+GALLERY_WORKERS = int(os.getenv('NEURACV_GALLERY_WORKERS', '4'))
+# Bump when the thumbnail markup changes to invalidate cached thumbnails
+GALLERY_VERSION = 1
+THUMBNAIL_SCALE = 0.45
+THUMBNAIL_HEIGHT = 360
+
+SAMPLE_RESUME = {
+    'personal_info': {
+        'name': 'Alex Morgan',
+        'email': 'alex.morgan@example.com',
+        'phone': '(555) 010-2030',
+        'location': 'Austin, TX',
+        'linkedin': 'linkedin.com/in/alexmorgan',
+        'summary': 'Software engineer with 6 years of experience building reliable web services and data pipelines.'
+    },
+    'experience': [
+        {'title': 'Senior Software Engineer', 'company': 'Northwind Labs', 'start_date': '2021', 'end_date': 'Present',
+         'description': '• Led migration of the billing platform to Kubernetes, cutting deploy time 70%\n'
+                        '• Designed an event pipeline processing 3M messages/day'},
+        {'title': 'Software Engineer', 'company': 'Contoso', 'start_date': '2018', 'end_date': '2021',
+         'description': '• Built REST APIs in Python and PostgreSQL serving 200k users\n'
+                        '• Reduced p95 latency 45% through query optimization'}
+    ],
+    'education': [{'degree': 'B.S. Computer Science', 'institution': 'University of Texas', 'year': '2018'}],
+    'technical_skills': ['Python', 'Go', 'PostgreSQL', 'Kubernetes', 'AWS', 'Kafka'],
+    'soft_skills': ['Mentoring', 'Communication'],
+    'projects': [{'name': 'Open-source rate limiter', 'description': 'Token-bucket limiter used by 40+ projects'}]
+}
+
+_THUMBNAIL_STYLE = (
+    f"<style>html{{zoom:{THUMBNAIL_SCALE};overflow:hidden}}body{{pointer-events:none}}</style>"
+)
+
+# Thumbnail HTML keyed by (gallery version, template, template version, resume content hash)
+_thumbnail_cache = LRUCache(max_entries=256, max_bytes=16 * 1024 * 1024)
+_executor = None
+_executor_lock = threading.Lock()
+_inflight = {}
+_inflight_lock = threading.Lock()
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _executor_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=GALLERY_WORKERS, thread_name_prefix='gallery')
+    return _executor
+
+def _thumbnail_key(template_name: str, resume_data: Dict) -> str:
+    return canonical_hash(
+        '__thumbnail__', GALLERY_VERSION, template_name, template_version(template_name),
+        Resume.from_dict(resume_data).content_hash
+    )
+
+def _build_thumbnail(template_name: str, resume_data: Dict, cache_key: str) -> str:
+    html = preview_html(render_template(template_name, resume_data))
+    head_end = html.lower().find('</head>')
+    thumbnail = html[:head_end] + _THUMBNAIL_STYLE + html[head_end:] if head_end >= 0 else _THUMBNAIL_STYLE + html
+    _thumbnail_cache.put(cache_key, thumbnail)
+    return thumbnail
+
+def _render_in_background(template_name: str, resume_data: Dict, cache_key: str) -> str:
+    try:
+        return _build_thumbnail(template_name, resume_data, cache_key)
+    finally:
+        with _inflight_lock:
+            _inflight.pop(cache_key, None)
+
+def gallery_thumbnails(resume_data: Optional[Dict] = None) -> Dict[str, str]:
+    """Scaled-down preview HTML of every template, rendering only thumbnails that are missing or stale"""
+    resume_data = resume_data or SAMPLE_RESUME
+    thumbnails = {}
+    for template_name in get_all_templates():
+        cache_key = _thumbnail_key(template_name, resume_data)
+        thumbnail = _thumbnail_cache.get(cache_key)
+        if thumbnail is None:
+            with _inflight_lock:
+                future = _inflight.get(cache_key)
+            # Jinja rendering holds the GIL, so handing a page view's misses to the pool only
+            # adds latency; wait on the pool only for a render it has already started
+            thumbnail = future.result() if future is not None else _build_thumbnail(template_name, resume_data, cache_key)
+        thumbnails[template_name] = thumbnail
+    return thumbnails
+
+def prerender_gallery(resume_data: Optional[Dict] = None) -> None:
+    """Render missing thumbnails on the thread pool without waiting, so the next gallery view is already warm"""
+    # The session keeps editing its own dict while the pool renders
+    resume_data = copy.deepcopy(resume_data) if resume_data else SAMPLE_RESUME
+    for template_name in get_all_templates():
+        cache_key = _thumbnail_key(template_name, resume_data)
+        if _thumbnail_cache.get(cache_key) is not None:
+            continue
+        # Sessions warming the same data share one render per thumbnail
+        with _inflight_lock:
+            if cache_key not in _inflight:
+                _inflight[cache_key] = _get_executor().submit(_render_in_background, template_name, resume_data, cache_key)
+
+def gallery_cache_stats() -> dict:
+    """Hit/miss counters of the thumbnail cache"""
+    return _thumbnail_cache.stats()